@@ -31,6 +31,7 @@ import FunctionalDependency from "./services/normalization/FunctionalDependency.
 import CandidateKeyFinder from "./services/normalization/CandidateKeyFinder.js";
 import NormalFormChecker from "./services/normalization/NormalFormChecker.js";
 import SchemaDecomposer from "./services/normalization/SchemaDecomposer.js";
+import FDIndex from "./services/normalization/FDIndex.js";
 
 // Normalization API endpoint
 app.post("/api/normalize", async (req, res) => {
@@ -46,12 +47,13 @@ app.post("/api/normalize", async (req, res) => {
     const keyFinder = new CandidateKeyFinder(attributes, fds);
     const candidateKeys = keyFinder.findCandidateKeys();
 
-    // Step 3: Check normal forms
-    const nfChecker = new NormalFormChecker({ tableName, attributes }, fds, candidateKeys);
+    // Step 3: Check normal forms (FD index shared with the decomposer)
+    const fdIndex = new FDIndex(fds, attributes, candidateKeys);
+    const nfChecker = new NormalFormChecker({ tableName, attributes }, fdIndex);
     const analysis = nfChecker.analyzeAllForms(data);
 
     // Step 4: Decompose schema
-    const decomposer = new SchemaDecomposer({ tableName, attributes }, fds, candidateKeys);
+    const decomposer = new SchemaDecomposer({ tableName, attributes }, fdIndex);
     const normalized = decomposer.normalizeComplete();
 
     res.json({
@@ -19,6 +19,10 @@ class CandidateKeyFinder {
   constructor(attributes, functionalDependencies) {
     this.attributes = attributes;
     this.fds = functionalDependencies;
+    this.closureKernel = FunctionalDependency.prepareClosureKernel(functionalDependencies, attributes);
+    this.encoder = FunctionalDependency.maskEncoder(attributes);
+    this.attrBits = attributes.map(attr => this.encoder.bit(attr));
+    this._superkeyCache = new Map();
     this.candidateKeys = [];
   }
 
@@ -26,6 +30,12 @@ class CandidateKeyFinder {
    * Find all candidate keys using bottom-up approach
    */
   findCandidateKeys() {
+    // Without FDs nothing is implied, so the only key is the whole schema
+    if (this.fds.length === 0) {
+      this.candidateKeys = [[...this.attributes]];
+      return this.candidateKeys;
+    }
+
     const allAttrs = new Set(this.attributes);
     const candidateKeys = [];
 
@@ -45,14 +55,28 @@ class CandidateKeyFinder {
     // Step 3: Add other attributes incrementally
     const maxSize = Math.min(this.attributes.length, 4); // Limit search
 
-    for (let size = mustInclude.length + 1; size <= maxSize; size++) {
-      const combinations = this.generateCombinations(otherAttrs, size - mustInclude.length);
-
-      for (const combo of combinations) {
-        const candidateSet = [...mustInclude, ...combo];
+    // Breadth-first enumeration: the frontier holds every combination of
+    // the current size as (attribute mask, last otherAttrs position), and
+    // each round extends it by one later attribute
+    const otherBits = otherAttrs.map(attr => this.encoder.bit(attr));
+    let frontier = [{ mask: this.encoder.mask(mustInclude), last: -1 }];
 
-        if (this.isSuperkey(candidateSet) && this.isMinimal(candidateSet)) {
-          candidateKeys.push(candidateSet);
+    for (let size = mustInclude.length + 1; size <= maxSize; size++) {
+      const next = [];
+      for (const { mask, last } of frontier) {
+        for (let i = last + 1; i < otherAttrs.length; i++) {
+          next.push({ mask: mask | otherBits[i], last: i });
+        }
+      }
+      frontier = next;
+
+      for (const { mask } of frontier) {
+        if (this.isSuperkeyMask(mask) && this.isMinimalMask(mask)) {
+          // Only accepted keys are materialized as attribute lists
+          candidateKeys.push([
+            ...mustInclude,
+            ...otherAttrs.filter((_, i) => mask & otherBits[i])
+          ]);
         }
       }
 
@@ -75,21 +99,41 @@ class CandidateKeyFinder {
    * Check if attribute set is a superkey (closure = all attributes)
    */
   isSuperkey(attributeSet) {
-    const closure = FunctionalDependency.computeClosure(
-      attributeSet, 
-      this.attributes, 
-      this.fds
-    );
-    return closure.length === this.attributes.length;
+    return this.isSuperkeyMask(this.encoder.mask(attributeSet));
+  }
+
+  /**
+   * Superkey test on an attribute bitmask, memoized per mask
+   */
+  isSuperkeyMask(mask) {
+    // With no FDs the closure is the set itself
+    if (this.fds.length === 0) {
+      return this.attrBits.every(bit => mask & bit);
+    }
+    if (this._superkeyCache.has(mask)) {
+      return this._superkeyCache.get(mask);
+    }
+
+    const seed = [];
+    this.attrBits.forEach((bit, i) => {
+      if (mask & bit) seed.push(i);
+    });
+    const { size } = FunctionalDependency.closureOfIndices(seed, this.closureKernel);
+    const result = size === this.attributes.length;
+    this._superkeyCache.set(mask, result);
+    return result;
   }
 
   /**
    * Check if superkey is minimal (removing any attribute breaks superkey property)
    */
   isMinimal(superkey) {
-    for (const attr of superkey) {
-      const subset = superkey.filter(a => a !== attr);
-      if (this.isSuperkey(subset)) {
+    return this.isMinimalMask(this.encoder.mask(superkey));
+  }
+
+  isMinimalMask(mask) {
+    for (const bit of this.attrBits) {
+      if ((mask & bit) && this.isSuperkeyMask(mask ^ bit)) {
         return false; // Not minimal
       }
     }
@@ -103,32 +147,6 @@ class CandidateKeyFinder {
     const rhsAttributes = new Set(this.fds.map(fd => fd.rhs));
     return this.attributes.filter(attr => !rhsAttributes.has(attr));
   }
-
-  /**
-   * Generate all combinations of size k from array
-   */
-  generateCombinations(arr, k) {
-    if (k === 0) return [[]];
-    if (k > arr.length) return [];
-
-    const results = [];
-
-    function backtrack(start, current) {
-      if (current.length === k) {
-        results.push([...current]);
-        return;
-      }
-
-      for (let i = start; i < arr.length; i++) {
-        current.push(arr[i]);
-        backtrack(i + 1, current);
-        current.pop();
-      }
-    }
-
-    backtrack(0, []);
-    return results;
-  }
 }
 
 module.exports = CandidateKeyFinder;
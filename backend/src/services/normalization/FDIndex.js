@@ -0,0 +1,160 @@
+// backend/src/services/normalization/FDIndex.js
+
+/**
+ * FDIndex - Shared bitmask index over a set of functional dependencies
+ *
+ * Built once per analysis and shared by NormalFormChecker and SchemaDecomposer,
+ * so FD masks, LHS grouping and partial/transitive classification are
+ * computed a single time.
+ */
+
+const FunctionalDependency = require('./FunctionalDependency');
+
+class FDIndex {
+  constructor(fds, attributes, candidateKeys = []) {
+    this.fds = fds;
+    this.attributes = attributes;
+    this.candidateKeys = candidateKeys;
+    // FDs and keys may name attributes outside the schema; they get bits of
+    // their own so set tests stay exact (and are never mistaken for a schema
+    // attribute)
+    this.encoder = FunctionalDependency.maskEncoder([...new Set([
+      ...attributes,
+      ...fds.flatMap(fd => [...fd.lhs, fd.rhs]),
+      ...candidateKeys.flat()
+    ])]);
+
+    // Masks are kept beside the FDs (not on them) so FDs stay JSON-serializable
+    this._masks = new Map(fds.map(fd => [fd, this.computeMasks(fd)]));
+
+    const prime = this.findPrimeAttributes();
+    this.primeAttributes = prime.list;
+    this.primeMask = prime.mask;
+    this.keyMasks = this.packMasks(candidateKeys.map(key => this.encoder.mask(key)));
+
+    this.byLhsMask = this.groupByLhs(fds);
+
+    this.partialDeps = [];
+    this.transitiveDeps = [];
+    this.classify();
+  }
+
+  /**
+   * Single pass over the FDs routing each into partialDeps / transitiveDeps
+   */
+  classify() {
+    if (this.fds.length === 0) return;
+
+    for (const fd of this.fds) {
+      if (this.isPartialDependency(fd)) {
+        this.partialDeps.push(fd);
+      }
+      if (this.isTransitiveDependency(fd)) {
+        this.transitiveDeps.push(fd);
+      }
+    }
+  }
+
+  /**
+   * Bitmasks for an FD: { lhsMask, rhsBit, attrsMask (lhs ∪ rhs) }
+   */
+  masks(fd) {
+    return this._masks.get(fd) || this.computeMasks(fd);
+  }
+
+  computeMasks(fd) {
+    const lhsMask = this.encoder.mask(fd.lhs);
+    const rhsBit = this.encoder.bit(fd.rhs);
+    return { lhsMask, rhsBit, attrsMask: lhsMask | rhsBit };
+  }
+
+  /**
+   * FDs whose attributes all lie within the given attribute mask
+   */
+  fdsWithin(attrMask) {
+    const result = [];
+    for (const fd of this.fds) {
+      const { attrsMask } = this.masks(fd);
+      if ((attrsMask & attrMask) === attrsMask) result.push(fd);
+    }
+    return result;
+  }
+
+  /**
+   * Prime attributes = attributes that appear in any candidate key
+   * Returns: { mask, list } - the bitmask for tests, the list for output
+   */
+  findPrimeAttributes() {
+    const prime = new Set();
+    for (const key of this.candidateKeys) {
+      key.forEach(attr => prime.add(attr));
+    }
+    const list = Array.from(prime);
+    return { mask: this.encoder.mask(list), list };
+  }
+
+  /**
+   * Store masks in a typed array sized to the encoded width
+   * (Uint32Array up to 30 attributes, BigUint64Array up to 64)
+   */
+  packMasks(masks) {
+    const width = this.encoder.width;
+    if (width <= 30) return Uint32Array.from(masks);
+    if (width <= 64) return BigUint64Array.from(masks);
+    return masks;
+  }
+
+  isPrimeAttribute(attr) {
+    return this.encoder.has(attr) && this.isPrime(this.encoder.bit(attr));
+  }
+
+  /**
+   * Group FDs by determinant without touching fd.lhs
+   * Returns: Map<lhsMask, { lhs: string[] (sorted copy), rhs: string[] }>
+   */
+  groupByLhs(fds) {
+    const grouped = new Map();
+    for (const fd of fds) {
+      const { lhsMask } = this.masks(fd);
+      let group = grouped.get(lhsMask);
+      if (!group) {
+        // Only the first FD per determinant pays for the sorted copy
+        group = { lhs: fd.lhs.slice().sort(), rhs: [] };
+        grouped.set(lhsMask, group);
+      }
+      group.rhs.push(fd.rhs);
+    }
+    return grouped;
+  }
+
+  isPrime(bit) {
+    return (bit & this.primeMask) !== this.encoder.empty;
+  }
+
+  /**
+   * X -> Y is partial if Y is non-prime and X is a proper subset of some key
+   */
+  isPartialDependency(fd) {
+    const { lhsMask, rhsBit } = this.masks(fd);
+    if (this.isPrime(rhsBit)) {
+      return false;
+    }
+    return this.keyMasks.some(keyMask =>
+      (lhsMask & keyMask) === lhsMask && lhsMask !== keyMask
+    );
+  }
+
+  /**
+   * X -> Y is transitive if X and Y are non-prime and X is not a key
+   */
+  isTransitiveDependency(fd) {
+    const { lhsMask, rhsBit } = this.masks(fd);
+    const lhsNonPrime = (lhsMask & this.primeMask) === this.encoder.empty;
+    if (!lhsNonPrime || this.isPrime(rhsBit)) {
+      return false;
+    }
+    return !this.keyMasks.includes(lhsMask);
+  }
+}
+
+module.exports = FDIndex;
@@ -6,11 +6,54 @@
  * Complexity: O(n²·m) where n = rows, m = columns
  */
 
+/**
+ * Factorize a column of values into dense integer codes
+ * Returns: { codes: Int32Array, categories: Array, cardinality: number }
+ */
+function buildCodesColumn(length, valueAt) {
+  const index = new Map();
+  const categories = [];
+  const codes = new Int32Array(length);
+  for (let i = 0; i < length; i++) {
+    const value = valueAt(i);
+    let code = index.get(value);
+    if (code === undefined) {
+      code = categories.length;
+      categories.push(value);
+      index.set(value, code);
+    }
+    codes[i] = code;
+  }
+  return { codes, categories, cardinality: categories.length };
+}
+
 class FunctionalDependency {
+  /**
+   * @param data - array of row objects, or columnar { columns: { attr: Array } }
+   *   (row arrays carrying a d3-dsv style .columns header list are rows)
+   */
   constructor(data, threshold = 0.98) {
-    this.data = data || [];
-    this.attributes = Object.keys((data && data[0]) || {});
+    if (data && !Array.isArray(data) && data.columns) {
+      this.data = null;
+      this._rawColumns = data.columns;
+      this.attributes = Object.keys(data.columns);
+      this.rowCount = this.attributes.length > 0 ? data.columns[this.attributes[0]].length : 0;
+      for (const attr of this.attributes) {
+        if (data.columns[attr].length !== this.rowCount) {
+          throw new Error(
+            `Column ${attr} has ${data.columns[attr].length} values, expected ${this.rowCount}`
+          );
+        }
+      }
+    } else {
+      this.data = data || [];
+      this._rawColumns = null;
+      this.attributes = Object.keys((data && data[0]) || {});
+      this.rowCount = this.data.length;
+    }
     this.threshold = threshold; // FD confidence threshold
+    this._columns = new Map(); // attr -> { codes: Int32Array, categories, cardinality }
+    this._keyColumns = new Map(); // attr -> same shape, grouped by string form
   }
 
   /**
@@ -19,15 +62,27 @@ class FunctionalDependency {
    */
   detectAll() {
     const fds = [];
+    const n = this.rowCount;
+    const card = attr => this.getColumn(attr).cardinality;
+    const lhsCard = attr => this.getKeyColumn(attr).cardinality;
+
+    // Pigeonhole bound: X -> Y has at least |Y| - |X| violations (|X| counted
+    // in LHS groups), so skip candidates whose best possible confidence is
+    // below the threshold
+    const cannotHold = (lhsCard, rhs) =>
+      1 - (card(rhs) - Math.min(lhsCard, n)) / n < this.threshold;
 
     // For each attribute as potential RHS
     for (const rhs of this.attributes) {
+      const singleHolds = new Set();
+
       // Try single attributes as LHS
       for (const lhs of this.attributes) {
-        if (lhs !== rhs) {
+        if (lhs !== rhs && !cannotHold(lhsCard(lhs), rhs)) {
           const fd = this.testFD([lhs], rhs);
           if (fd.holds) {
             fds.push({ lhs: [lhs], rhs, confidence: fd.confidence });
+            singleHolds.add(lhs);
           }
         }
       }
@@ -37,11 +92,16 @@ class FunctionalDependency {
         for (let i = 0; i < this.attributes.length; i++) {
           for (let j = i + 1; j < this.attributes.length; j++) {
             const lhs = [this.attributes[i], this.attributes[j]];
-            if (!lhs.includes(rhs)) {
-              const fd = this.testFD(lhs, rhs);
-              if (fd.holds) {
-                fds.push({ lhs, rhs, confidence: fd.confidence });
-              }
+            // A pair containing a determining single attribute is redundant
+            if (lhs.includes(rhs) || singleHolds.has(lhs[0]) || singleHolds.has(lhs[1])) {
+              continue;
+            }
+            if (cannotHold(lhsCard(lhs[0]) * lhsCard(lhs[1]), rhs)) {
+              continue;
+            }
+            const fd = this.testFD(lhs, rhs);
+            if (fd.holds) {
+              fds.push({ lhs, rhs, confidence: fd.confidence });
             }
           }
         }
@@ -54,27 +114,58 @@ class FunctionalDependency {
    * Test if X -> Y holds (X functionally determines Y)
    */
   testFD(lhs, rhs) {
-    const groups = new Map();
+    const keyFn = this.buildKeyFn(lhs);
+    const rhsCodes = this.getColumn(rhs).codes;
+    const n = this.rowCount;
+    let extras = null; // LHS key -> Set of RHS codes, only for violating groups
     let violations = 0;
 
-    // Group rows by LHS values
-    for (const row of this.data) {
-      const lhsKey = lhs.map(attr => row[attr]).join('|');
-      const rhsValue = row[rhs];
-      if (!groups.has(lhsKey)) {
-        groups.set(lhsKey, new Set());
+    // Called only when a group sees an RHS value different from its first one
+    const noteMismatch = (lhsKey, firstValue, rhsValue) => {
+      if (!extras) extras = new Map();
+      let seen = extras.get(lhsKey);
+      if (!seen) {
+        seen = new Set([firstValue]);
+        extras.set(lhsKey, seen);
       }
-      groups.get(lhsKey).add(rhsValue);
-    }
+      if (!seen.has(rhsValue)) {
+        seen.add(rhsValue);
+        violations++;
+      }
+    };
 
-    // Count violations (where LHS maps to multiple RHS values)
-    for (const rhsValues of groups.values()) {
-      if (rhsValues.size > 1) {
-        violations += rhsValues.size - 1;
+    // Group rows by LHS values; each extra distinct RHS value is a violation
+    const keySpace = lhs.reduce((size, attr) => size * this.getKeyColumn(attr).cardinality, 1);
+    if (keySpace <= n + 1024) {
+      // Dense keys: first RHS code per group in a flat table (-1 = unseen)
+      const first = new Int32Array(keySpace).fill(-1);
+      // Single-attribute LHS: walk the two code columns directly
+      const lhsCodes = lhs.length === 1 ? this.getKeyColumn(lhs[0]).codes : null;
+      for (let i = 0; i < n; i++) {
+        const lhsKey = lhsCodes ? lhsCodes[i] : keyFn(i);
+        const rhsValue = rhsCodes[i];
+        const firstValue = first[lhsKey];
+        if (firstValue === -1) {
+          first[lhsKey] = rhsValue;
+        } else if (firstValue !== rhsValue) {
+          noteMismatch(lhsKey, firstValue, rhsValue);
+        }
+      }
+    } else {
+      const first = new Map(); // LHS key -> first RHS code seen
+      for (let i = 0; i < n; i++) {
+        const lhsKey = keyFn(i);
+        const rhsValue = rhsCodes[i];
+        const firstValue = first.get(lhsKey);
+        if (firstValue === undefined) {
+          first.set(lhsKey, rhsValue);
+        } else if (firstValue !== rhsValue) {
+          noteMismatch(lhsKey, firstValue, rhsValue);
+        }
       }
     }
 
-    const totalPairs = this.data.length;
+    const totalPairs = n;
     const confidence = 1 - (violations / totalPairs);
 
     return {
@@ -84,20 +175,102 @@ class FunctionalDependency {
     };
   }
 
+  /**
+   * Build a row-index -> group key function specialized for the LHS arity
+   * Keys are packed integers while exact, else code strings joined by \x1f
+   */
+  buildKeyFn(lhs) {
+    const columns = lhs.map(attr => this.getKeyColumn(attr));
+
+    if (columns.length === 1) {
+      const codes = columns[0].codes;
+      return i => codes[i];
+    }
+
+    const keySpace = columns.reduce((size, col) => size * col.cardinality, 1);
+    const packed = keySpace <= Number.MAX_SAFE_INTEGER;
+
+    if (columns.length === 2 && packed) {
+      const [a, b] = columns;
+      const codesA = a.codes;
+      const codesB = b.codes;
+      const cardB = b.cardinality;
+      return i => codesA[i] * cardB + codesB[i];
+    }
+
+    if (packed) {
+      return i => {
+        let key = 0;
+        for (const col of columns) key = key * col.cardinality + col.codes[i];
+        return key;
+      };
+    }
+    return i => columns.map(col => col.codes[i]).join('\x1f');
+  }
+
+  /**
+   * Factorize a column into dense integer codes, once per attribute
+   * Returns: { codes: Int32Array, categories: Array, cardinality: number }
+   */
+  getColumn(attr) {
+    if (!this._columns.has(attr)) {
+      const column = this._rawColumns && this._rawColumns[attr];
+      const valueAt = column ? i => column[i] : i => this.data[i][attr];
+      this._columns.set(attr, buildCodesColumn(this.rowCount, valueAt));
+    }
+    return this._columns.get(attr);
+  }
+
+  /**
+   * Column codes for grouping rows by LHS value. Values are compared by
+   * their string form (null and undefined as ''), so 1 and '1', or a blank
+   * and a missing cell, fall in one group; RHS values keep exact equality.
+   * Shares the getColumn codes when no values merge.
+   */
+  getKeyColumn(attr) {
+    if (!this._keyColumns.has(attr)) {
+      const column = this.getColumn(attr);
+      const merged = buildCodesColumn(column.cardinality, code => {
+        const value = column.categories[code];
+        return value == null ? '' : String(value);
+      });
+
+      let keyColumn = column;
+      if (merged.cardinality !== column.cardinality) {
+        const codes = new Int32Array(this.rowCount);
+        for (let i = 0; i < this.rowCount; i++) {
+          codes[i] = merged.codes[column.codes[i]];
+        }
+        keyColumn = { codes, categories: merged.categories, cardinality: merged.cardinality };
+      }
+      this._keyColumns.set(attr, keyColumn);
+    }
+    return this._keyColumns.get(attr);
+  }
+
   /**
    * Remove redundant FDs (if X->Y and X⊂Z->Y, remove Z->Y)
    */
   removeRedundant(fds) {
+    const masks = FunctionalDependency.lhsMasks(fds, this.attributes);
+
+    // Bucket FD indices by RHS so only same-RHS FDs are compared
+    const byRhs = new Map();
+    fds.forEach((fd, i) => {
+      if (!byRhs.has(fd.rhs)) {
+        byRhs.set(fd.rhs, []);
+      }
+      byRhs.get(fd.rhs).push(i);
+    });
+
     const result = [];
-    for (const fd of fds) {
+    fds.forEach((fd, i) => {
+      const mask = masks[i];
       let isRedundant = false;
-      for (const other of fds) {
-        if (fd === other) continue;
-        if (
-          other.rhs === fd.rhs &&
-          other.lhs.every(attr => fd.lhs.includes(attr)) &&
-          other.lhs.length < fd.lhs.length
-        ) {
+      for (const j of byRhs.get(fd.rhs)) {
+        const other = masks[j];
+        // other.lhs is a proper subset of fd.lhs
+        if (j !== i && other !== mask && (mask & other) === other) {
           isRedundant = true;
           break;
         }
@@ -105,31 +278,149 @@ class FunctionalDependency {
       if (!isRedundant) {
         result.push(fd);
       }
-    }
+    });
     return result;
   }
 
   /**
-   * Compute attribute closure (X+) under a set of FDs
-   * Used for candidate key detection
+   * Encode each FD's LHS as an attribute bitmask (one bit per attribute).
+   * LHS attributes outside `attributes` get bits of their own.
    */
-  static computeClosure(attributes, allAttributes, fds) {
-    let closure = new Set(attributes);
-    let changed = true;
-    while (changed) {
-      changed = false;
-      for (const fd of fds) {
-        if (
-          fd.lhs.every(attr => closure.has(attr)) &&
-          !closure.has(fd.rhs)
-        ) {
-          closure.add(fd.rhs);
-          changed = true;
-        }
+  static lhsMasks(fds, attributes) {
+    const universe = [...new Set([...attributes, ...fds.flatMap(fd => fd.lhs)])];
+    const encoder = FunctionalDependency.maskEncoder(universe);
+    return fds.map(fd => encoder.mask(fd.lhs));
+  }
+
+  /**
+   * Build an encoder from attribute sets to bitmasks over `attributes`.
+   * Falls back to BigInt masks for schemas wider than 30 attributes.
+   * Attributes outside `attributes` have no bit and are rejected.
+   * Returns: { empty, width, has(attr), bit(attr), mask(attrs) }
+   */
+  static maskEncoder(attributes) {
+    const attrIndex = new Map(attributes.map((a, i) => [a, i]));
+    const wide = attributes.length > 30;
+    const empty = wide ? 0n : 0;
+    const indexOf = attr => {
+      const i = attrIndex.get(attr);
+      if (i === undefined) {
+        throw new Error(`Attribute ${attr} is not in the encoded attribute set`);
       }
+      return i;
+    };
+    const bit = wide
+      ? attr => 1n << BigInt(indexOf(attr))
+      : attr => 1 << indexOf(attr);
+    return {
+      empty,
+      width: attributes.length,
+      has: attr => attrIndex.has(attr),
+      bit,
+      mask: attrs => attrs.reduce((m, attr) => m | bit(attr), empty)
+    };
+  }
+
+  /**
+   * Compute attribute closure (X+) under a set of FDs
+   * Name-based wrapper over the typed closure kernel (closureOfIndices);
+   * attributes outside allAttributes are kept, as seeds and as FD targets
+   *
+   * Algorithm: LinClosure - each FD keeps a counter of LHS attributes not yet
+   * in the closure and fires when it reaches zero, O(Σ|lhs| + |fds|)
+   */
+  static computeClosure(attributes, allAttributes, fds, prepared = null) {
+    const kernel = prepared || FunctionalDependency.prepareLinClosure(fds);
+    const { names, attrIndex } = kernel;
+    const closure = new Set(attributes);
+
+    const seed = [];
+    for (const attr of closure) {
+      if (attrIndex.has(attr)) seed.push(attrIndex.get(attr));
     }
+    const { inClosure } = FunctionalDependency.closureOfIndices(seed, kernel);
+    names.forEach((name, i) => {
+      if (inClosure[i]) closure.add(name);
+    });
     return Array.from(closure);
   }
+
+  /**
+   * Build a closure kernel keyed by attribute name, once per FD set, over
+   * every attribute the FDs mention
+   * Returns: the prepareClosureKernel fields plus { names, attrIndex }
+   */
+  static prepareLinClosure(fds) {
+    const names = [...new Set(fds.flatMap(fd => [...fd.lhs, fd.rhs]))];
+    return {
+      ...FunctionalDependency.prepareClosureKernel(fds, names),
+      names,
+      attrIndex: new Map(names.map((a, i) => [a, i]))
+    };
+  }
+
+  /**
+   * Integer-only LinClosure index: attributes are positions in `attributes`,
+   * counters and RHS targets live in typed arrays
+   * Returns: { nAttrs, attrToFds: Int32Array[], lhsSizes: Int32Array, rhsIdx: Int32Array }
+   */
+  static prepareClosureKernel(fds, attributes) {
+    const attrIndex = new Map(attributes.map((a, i) => [a, i]));
+    const buckets = attributes.map(() => []);
+    const lhsSizes = new Int32Array(fds.length);
+    const rhsIdx = new Int32Array(fds.length);
+
+    fds.forEach((fd, i) => {
+      const lhs = new Set(fd.lhs);
+      // LHS attributes outside the schema are never reached, so the FD never fires
+      lhsSizes[i] = lhs.size;
+      for (const attr of lhs) {
+        if (attrIndex.has(attr)) buckets[attrIndex.get(attr)].push(i);
+      }
+      rhsIdx[i] = attrIndex.has(fd.rhs) ? attrIndex.get(fd.rhs) : -1;
+    });
+
+    return {
+      nAttrs: attributes.length,
+      attrToFds: buckets.map(b => Int32Array.from(b)),
+      lhsSizes,
+      rhsIdx
+    };
+  }
+
+  /**
+   * Closure over attribute positions using a prepared closure kernel
+   * Returns: Uint8Array membership flags, plus the closure size
+   */
+  static closureOfIndices(seed, kernel) {
+    const { nAttrs, attrToFds, lhsSizes, rhsIdx } = kernel;
+    const counter = lhsSizes.slice();
+    const inClosure = new Uint8Array(nAttrs);
+    const queue = new Int32Array(nAttrs); // each attribute is enqueued once
+    let head = 0;
+    let tail = 0;
+
+    const add = attr => {
+      if (attr >= 0 && !inClosure[attr]) {
+        inClosure[attr] = 1;
+        queue[tail++] = attr;
+      }
+    };
+
+    seed.forEach(add);
+    for (let i = 0; i < counter.length; i++) {
+      if (counter[i] === 0) add(rhsIdx[i]);
+    }
+
+    while (head < tail && tail < nAttrs) {
+      const fdsOfAttr = attrToFds[queue[head++]];
+      for (let j = 0; j < fdsOfAttr.length; j++) {
+        const i = fdsOfAttr[j];
+        if (--counter[i] === 0) add(rhsIdx[i]);
+      }
+    }
+    return { inClosure, size: tail };
+  }
 }
 
 export default FunctionalDependency;
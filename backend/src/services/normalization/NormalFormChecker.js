@@ -7,23 +7,20 @@
  * Checks compliance with 1NF, 2NF, 3NF, and BCNF
  */
 
-class NormalFormChecker {
-  constructor(schema, fds, candidateKeys) {
-    this.schema = schema; // { tableName, attributes }
-    this.fds = fds;
-    this.candidateKeys = candidateKeys;
-    this.primeAttributes = this.findPrimeAttributes();
-  }
+const FDIndex = require('./FDIndex');
 
+class NormalFormChecker {
   /**
-   * Prime attributes = attributes that appear in any candidate key
+   * @param fds - shared FDIndex, or a raw FD array (an index is built from it)
    */
-  findPrimeAttributes() {
-    const prime = new Set();
-    for (const key of this.candidateKeys) {
-      key.forEach(attr => prime.add(attr));
-    }
-    return Array.from(prime);
+  constructor(schema, fds, candidateKeys) {
+    this.schema = schema; // { tableName, attributes }
+    this.index = fds instanceof FDIndex
+      ? fds
+      : new FDIndex(fds, schema.attributes, candidateKeys);
+    this.fds = this.index.fds;
+    this.candidateKeys = this.index.candidateKeys;
+    this.primeAttributes = this.index.primeAttributes;
   }
 
   /**
@@ -33,12 +30,21 @@ class NormalFormChecker {
    * - Each cell contains single value
    * 
    * Note: We assume CSV data is already in 1NF by structure
+   *
+   * Accepts row objects or columnar data of the form { columns: { attr: Array } }
+   * (row arrays from d3-dsv also carry a .columns header list, so arrays are
+   * always treated as rows)
    */
   check1NF(sampleData) {
+    if (sampleData && !Array.isArray(sampleData) && sampleData.columns) {
+      return this.check1NFColumns(sampleData.columns);
+    }
+
     for (const row of sampleData) {
-      for (const [key, value] of Object.entries(row)) {
+      for (const key in row) {
+        const value = row[key];
         // Check if value is array or object
-        if (Array.isArray(value) || (typeof value === 'object' && value !== null)) {
+        if (typeof value === 'object' && value !== null) {
           return {
             satisfied: false,
             violations: [`Attribute ${key} contains non-atomic value`]
@@ -50,6 +56,29 @@ class NormalFormChecker {
     return { satisfied: true, violations: [] };
   }
 
+  /**
+   * 1NF check over columnar sample data: { attr: Array | TypedArray }
+   * Typed array columns can only hold scalars and are skipped outright
+   */
+  check1NFColumns(columns) {
+    for (const attr of Object.keys(columns)) {
+      const col = columns[attr];
+      if (ArrayBuffer.isView(col)) continue;
+
+      for (let i = 0; i < col.length; i++) {
+        const value = col[i];
+        if (typeof value === 'object' && value !== null) {
+          return {
+            satisfied: false,
+            violations: [`Attribute ${attr} contains non-atomic value`]
+          };
+        }
+      }
+    }
+
+    return { satisfied: true, violations: [] };
+  }
+
   /**
    * Check Second Normal Form (2NF)
    * Requirements:
@@ -57,20 +86,16 @@ class NormalFormChecker {
    * - No partial dependencies (non-prime attributes fully depend on entire candidate key)
    */
   check2NF() {
-    const violations = [];
-
-    for (const fd of this.fds) {
-      const isPartialDep = this.isPartialDependency(fd);
-
-      if (isPartialDep) {
-        violations.push({
-          lhs: fd.lhs,
-          rhs: fd.rhs,
-          reason: `${fd.rhs} partially depends on ${fd.lhs.join(', ')}`
-        });
-      }
+    if (this.fds.length === 0) {
+      return { satisfied: true, violations: [] };
     }
 
+    const violations = this.index.partialDeps.map(fd => ({
+      lhs: fd.lhs,
+      rhs: fd.rhs,
+      reason: `${fd.rhs} partially depends on ${fd.lhs.join(', ')}`
+    }));
+
     return {
       satisfied: violations.length === 0,
       violations
@@ -85,24 +110,7 @@ class NormalFormChecker {
    * 3. Y is not in X
    */
   isPartialDependency(fd) {
-    const { lhs, rhs } = fd;
-
-    // Check if RHS is non-prime
-    if (this.primeAttributes.includes(rhs)) {
-      return false;
-    }
-
-    // Check if LHS is proper subset of any candidate key
-    for (const key of this.candidateKeys) {
-      const isProperSubset = lhs.every(attr => key.includes(attr)) && 
-                            lhs.length < key.length;
-
-      if (isProperSubset) {
-        return true;
-      }
-    }
-
-    return false;
+    return this.index.isPartialDependency(fd);
   }
 
   /**
@@ -112,20 +120,16 @@ class NormalFormChecker {
    * - No transitive dependencies (non-prime attrs don't depend on other non-prime attrs)
    */
   check3NF() {
-    const violations = [];
-
-    for (const fd of this.fds) {
-      const isTransitive = this.isTransitiveDependency(fd);
-
-      if (isTransitive) {
-        violations.push({
-          lhs: fd.lhs,
-          rhs: fd.rhs,
-          reason: `${fd.rhs} transitively depends on ${fd.lhs.join(', ')}`
-        });
-      }
+    if (this.fds.length === 0) {
+      return { satisfied: true, violations: [] };
     }
 
+    const violations = this.index.transitiveDeps.map(fd => ({
+      lhs: fd.lhs,
+      rhs: fd.rhs,
+      reason: `${fd.rhs} transitively depends on ${fd.lhs.join(', ')}`
+    }));
+
     return {
       satisfied: violations.length === 0,
       violations
@@ -140,22 +144,7 @@ class NormalFormChecker {
    * 3. X is not a superkey
    */
   isTransitiveDependency(fd) {
-    const { lhs, rhs } = fd;
-
-    // Both LHS and RHS must be non-prime
-    const lhsNonPrime = lhs.every(attr => !this.primeAttributes.includes(attr));
-    const rhsNonPrime = !this.primeAttributes.includes(rhs);
-
-    if (!lhsNonPrime || !rhsNonPrime) {
-      return false;
-    }
-
-    // LHS must not be a superkey
-    const isSuperkey = this.candidateKeys.some(key => 
-      key.length === lhs.length && key.every(attr => lhs.includes(attr))
-    );
-
-    return !isSuperkey;
+    return this.index.isTransitiveDependency(fd);
   }
 
   /**
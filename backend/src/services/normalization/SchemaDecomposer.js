@@ -7,20 +7,20 @@
  * Implements decomposition algorithms for 2NF and 3NF
  */
 
-const FunctionalDependency = require('./FunctionalDependency');
+const FDIndex = require('./FDIndex');
 
 class SchemaDecomposer {
+  /**
+   * @param fds - shared FDIndex, or a raw FD array (an index is built from it)
+   */
   constructor(originalSchema, fds, candidateKeys) {
     this.originalSchema = originalSchema;
-    this.fds = fds;
-    this.candidateKeys = candidateKeys;
-    this.primeAttributes = this.getPrimeAttributes();
-  }
-
-  getPrimeAttributes() {
-    const prime = new Set();
-    this.candidateKeys.forEach(key => key.forEach(attr => prime.add(attr)));
-    return Array.from(prime);
+    this.index = fds instanceof FDIndex
+      ? fds
+      : new FDIndex(fds, originalSchema.attributes, candidateKeys);
+    this.fds = this.index.fds;
+    this.candidateKeys = this.index.candidateKeys;
+    this.primeAttributes = this.index.primeAttributes;
   }
 
   /**
@@ -50,22 +50,32 @@ class SchemaDecomposer {
    * - Create separate tables for partially dependent attributes
    */
   decomposeTo2NF() {
+    // No FDs means no partial dependencies: only the main table remains
+    if (this.fds.length === 0) {
+      return {
+        tables: [{
+          name: this.originalSchema.tableName,
+          attributes: Array.from(new Set(this.originalSchema.attributes)),
+          primaryKey: this.candidateKeys[0],
+          foreignKeys: []
+        }],
+        transformations: [{
+          type: '2NF',
+          description: 'Removed partial dependencies',
+          changes: []
+        }]
+      };
+    }
+
     const tables = [];
     const mainAttributes = new Set(this.originalSchema.attributes);
     const removedAttributes = new Set();
 
     // Find partial dependencies
-    const partialDeps = this.fds.filter(fd => this.isPartialDependency(fd));
+    const partialDeps = this.index.partialDeps;
 
     // Group by LHS (determinant)
-    const grouped = new Map();
-    partialDeps.forEach(fd => {
-      const key = fd.lhs.sort().join('|');
-      if (!grouped.has(key)) {
-        grouped.set(key, { lhs: fd.lhs, rhs: [] });
-      }
-      grouped.get(key).rhs.push(fd.rhs);
-    });
+    const grouped = this.index.groupByLhs(partialDeps);
 
     // Create separate table for each partial dependency group
     let tableIndex = 1;
@@ -113,32 +123,32 @@ class SchemaDecomposer {
    * - Create separate tables for transitively dependent attributes
    */
   decomposeTo3NF(tables2NF) {
+    // No FDs means no transitive dependencies: tables pass through unchanged
+    if (this.fds.length === 0) {
+      return { tables: tables2NF.slice(), transformations: [] };
+    }
+
     const tables = [];
     const transformations = [];
 
     for (const table of tables2NF) {
-      const mainAttrs = new Set(table.attributes);
-      const removedAttrs = new Set();
-
       // Find transitive dependencies within this table
-      const tableFDs = this.fds.filter(fd => 
-        fd.lhs.every(attr => table.attributes.includes(attr)) &&
-        table.attributes.includes(fd.rhs)
-      );
+      const tableFDs = this.index.fdsWithin(this.index.encoder.mask(table.attributes));
 
       const transitiveDeps = tableFDs.filter(fd => 
         this.isTransitiveDependency(fd, table.primaryKey)
       );
 
+      // Tables already in 3NF are shared with the 2NF stage, not rebuilt
+      if (transitiveDeps.length === 0) {
+        tables.push(table);
+        continue;
+      }
+
+      const mainAttrs = new Set(table.attributes);
+
       // Group by determinant
-      const grouped = new Map();
-      transitiveDeps.forEach(fd => {
-        const key = fd.lhs.sort().join('|');
-        if (!grouped.has(key)) {
-          grouped.set(key, { lhs: fd.lhs, rhs: [] });
-        }
-        grouped.get(key).rhs.push(fd.rhs);
-      });
+      const grouped = this.index.groupByLhs(transitiveDeps);
 
       // Create new tables for transitive dependencies
       let subTableIndex = 1;
@@ -154,10 +164,7 @@ class SchemaDecomposer {
         });
 
         // Keep LHS as foreign key in main table, remove RHS
-        group.rhs.forEach(attr => {
-          mainAttrs.delete(attr);
-          removedAttrs.add(attr);
-        });
+        group.rhs.forEach(attr => mainAttrs.delete(attr));
 
         transformations.push({
           type: '3NF',
@@ -182,20 +189,14 @@ class SchemaDecomposer {
   }
 
   isPartialDependency(fd) {
-    const rhsNonPrime = !this.primeAttributes.includes(fd.rhs);
-    if (!rhsNonPrime) return false;
-
-    return this.candidateKeys.some(key => 
-      fd.lhs.every(attr => key.includes(attr)) && 
-      fd.lhs.length < key.length
-    );
+    return this.index.isPartialDependency(fd);
   }
 
   isTransitiveDependency(fd, primaryKey) {
-    const lhsNonPrime = fd.lhs.every(attr => !this.primeAttributes.includes(attr));
-    const rhsNonPrime = !this.primeAttributes.includes(fd.rhs);
-    const lhsNotKey = !fd.lhs.every(attr => primaryKey.includes(attr)) || 
-                      fd.lhs.length !== primaryKey.length;
+    const { lhsMask, rhsBit } = this.index.masks(fd);
+    const lhsNonPrime = (lhsMask & this.index.primeMask) === this.index.encoder.empty;
+    const rhsNonPrime = !this.index.isPrime(rhsBit);
+    const lhsNotKey = lhsMask !== this.index.encoder.mask(primaryKey);
 
     return lhsNonPrime && rhsNonPrime && lhsNotKey;
   }
@@ -204,35 +205,18 @@ class SchemaDecomposer {
    * Full decomposition pipeline
    */
   normalizeComplete() {
-    const result = {
-      stages: []
-    };
-
-    // Stage 1: 1NF
     const stage1NF = this.decomposeTo1NF();
-    result.stages.push({
-      normalForm: '1NF',
-      tables: stage1NF.tables,
-      transformations: stage1NF.transformations
-    });
-
-    // Stage 2: 2NF
     const stage2NF = this.decomposeTo2NF();
-    result.stages.push({
-      normalForm: '2NF',
-      tables: stage2NF.tables,
-      transformations: stage2NF.transformations
-    });
-
-    // Stage 3: 3NF
     const stage3NF = this.decomposeTo3NF(stage2NF.tables);
-    result.stages.push({
-      normalForm: '3NF',
-      tables: stage3NF.tables,
-      transformations: stage3NF.transformations
-    });
 
-    return result;
+    // Stages share unchanged table objects rather than copying them
+    return {
+      stages: [
+        { normalForm: '1NF', ...stage1NF },
+        { normalForm: '2NF', ...stage2NF },
+        { normalForm: '3NF', ...stage3NF }
+      ]
+    };
   }
 }
 
@@ -39,4 +39,36 @@ describe('CandidateKeyFinder', () => {
     expect(mustInclude).toContain('id');
     expect(mustInclude.length).toBe(1);
   });
+
+  test('memoizes superkey checks by attribute set', () => {
+    const attributes = ['A', 'B', 'C'];
+    const fds = [{ lhs: ['A'], rhs: 'B' }, { lhs: ['B'], rhs: 'C' }];
+    const finder = new CandidateKeyFinder(attributes, fds);
+    expect(finder.isSuperkey(['A'])).toBe(true);
+    expect(finder.isSuperkey(['B', 'C'])).toBe(false);
+    expect(finder.isSuperkey(['C', 'B'])).toBe(false);
+    expect(finder._superkeyCache.size).toBe(2);
+  });
+
+  test('finds composite keys of the smallest size only', () => {
+    const attributes = ['A', 'B', 'C', 'D'];
+    const fds = [
+      { lhs: ['A', 'B'], rhs: 'C' },
+      { lhs: ['C'], rhs: 'A' },
+      { lhs: ['A', 'B'], rhs: 'D' }
+    ];
+    const finder = new CandidateKeyFinder(attributes, fds);
+    const keys = finder.findCandidateKeys();
+    expect(keys).toContainEqual(['B', 'A']);
+    expect(keys).toContainEqual(['B', 'C']);
+    expect(keys.length).toBe(2);
+  });
+
+  test('with no FDs the only key is all attributes', () => {
+    const attributes = ['A', 'B', 'C'];
+    const finder = new CandidateKeyFinder(attributes, []);
+    expect(finder.findCandidateKeys()).toEqual([attributes]);
+    expect(finder.isSuperkey(['A', 'B'])).toBe(false);
+    expect(finder.isSuperkey(['C', 'B', 'A'])).toBe(true);
+  });
 });
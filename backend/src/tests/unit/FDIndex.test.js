@@ -0,0 +1,42 @@
+// backend/src/__tests__/unit/FDIndex.test.js
+
+import FDIndex from '../../services/normalization/FDIndex.js';
+
+describe('FDIndex', () => {
+  const attributes = ['StudentID', 'CourseID', 'StudentName', 'Instructor', 'Office'];
+  const fds = [
+    { lhs: ['StudentID'], rhs: 'StudentName' },
+    { lhs: ['CourseID'], rhs: 'Instructor' },
+    { lhs: ['Instructor'], rhs: 'Office' }
+  ];
+  const candidateKeys = [['StudentID', 'CourseID']];
+
+  test('classifies partial and transitive dependencies once', () => {
+    const index = new FDIndex(fds, attributes, candidateKeys);
+    expect(index.partialDeps.map(fd => fd.rhs)).toEqual(['StudentName', 'Instructor']);
+    expect(index.transitiveDeps.map(fd => fd.rhs)).toEqual(['Office']);
+    expect(index.primeAttributes).toEqual(['StudentID', 'CourseID']);
+  });
+
+  test('groups by determinant without mutating FD order', () => {
+    const multi = [
+      { lhs: ['CourseID', 'StudentID'], rhs: 'Instructor' },
+      { lhs: ['StudentID', 'CourseID'], rhs: 'Office' }
+    ];
+    const index = new FDIndex(multi, attributes, candidateKeys);
+    const groups = Array.from(index.byLhsMask.values());
+    expect(groups.length).toBe(1);
+    expect(groups[0].lhs).toEqual(['CourseID', 'StudentID']);
+    expect(groups[0].rhs).toEqual(['Instructor', 'Office']);
+    expect(multi[1].lhs).toEqual(['StudentID', 'CourseID']);
+  });
+
+  test('stores prime attributes and key masks as bitmasks', () => {
+    const index = new FDIndex(fds, attributes, candidateKeys);
+    expect(index.primeMask).toBe(0b11);
+    expect(index.keyMasks instanceof Uint32Array).toBe(true);
+    expect(Array.from(index.keyMasks)).toEqual([0b11]);
+    expect(index.isPrimeAttribute('CourseID')).toBe(true);
+    expect(index.isPrimeAttribute('Office')).toBe(false);
+  });
+});
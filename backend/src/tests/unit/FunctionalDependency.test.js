@@ -17,6 +17,51 @@ describe('FunctionalDependency', () => {
     expect(result.confidence).toBeCloseTo(1.0);
   });
 
+  test('tests composite LHS on factorized columns', () => {
+    const fd = new FunctionalDependency(sampleData);
+    expect(fd.testFD(['name', 'dept'], 'id').violations).toBe(1);
+    expect(fd.testFD(['id', 'name'], 'dept').holds).toBe(true);
+  });
+
+  test('groups LHS values by string form, as blank CSV cells arrive', () => {
+    // null, '' and undefined share one LHS group, as do 1 and '1'
+    const blanks = new FunctionalDependency([
+      { a: null, b: 1 }, { a: '', b: 2 }, { a: undefined, b: 3 }
+    ]);
+    expect(blanks.testFD(['a'], 'b').violations).toBe(2);
+
+    const mixed = new FunctionalDependency([{ a: 1, b: 'x' }, { a: '1', b: 'y' }]);
+    expect(mixed.testFD(['a'], 'b').violations).toBe(1);
+
+    // RHS values keep exact equality
+    const rhsMixed = new FunctionalDependency([{ a: 'k', b: 1 }, { a: 'k', b: '1' }]);
+    expect(rhsMixed.testFD(['a'], 'b').violations).toBe(1);
+  });
+
+  test('accepts columnar input equivalent to row objects', () => {
+    const columns = {
+      id: Int32Array.from(sampleData, r => r.id),
+      name: sampleData.map(r => r.name),
+      dept: sampleData.map(r => r.dept)
+    };
+    const fromRows = new FunctionalDependency(sampleData).detectAll();
+    const fromColumns = new FunctionalDependency({ columns }).detectAll();
+    expect(fromColumns).toEqual(fromRows);
+  });
+
+  test('treats row arrays carrying a .columns header list as rows', () => {
+    const rows = sampleData.slice();
+    rows.columns = ['id', 'name', 'dept'];
+    const fd = new FunctionalDependency(rows);
+    expect(fd.attributes).toEqual(['id', 'name', 'dept']);
+    expect(fd.rowCount).toBe(4);
+  });
+
+  test('rejects columnar input with unequal column lengths', () => {
+    const columns = { id: Int32Array.of(1, 2, 3), name: ['Alice', 'Bob'] };
+    expect(() => new FunctionalDependency({ columns })).toThrow('Column name has 2 values, expected 3');
+  });
+
   test('detects redundancy in FD detection', () => {
     const fd = new FunctionalDependency(sampleData);
     const fds = fd.detectAll();
@@ -27,6 +72,45 @@ describe('FunctionalDependency', () => {
     expect(foundDept.length).toBeGreaterThan(0);
   });
 
+  test('keeps a near-threshold FD whose LHS has fewer values than its RHS', () => {
+    // a has 10 values, b has 11: one violation in 20 rows, confidence 0.95
+    const rows = Array.from({ length: 20 }, (_, i) => ({
+      a: Math.floor(i / 2),
+      b: i === 19 ? 'extra' : Math.floor(i / 2)
+    }));
+    const fds = new FunctionalDependency(rows, 0.9).detectAll();
+    expect(fds).toContainEqual({ lhs: ['a'], rhs: 'b', confidence: 0.95 });
+  });
+
+  test('does not test pairs that contain a determining single attribute', () => {
+    const fd = new FunctionalDependency(sampleData);
+    const tested = [];
+    const testFD = fd.testFD.bind(fd);
+    fd.testFD = (lhs, rhs) => {
+      tested.push({ lhs, rhs });
+      return testFD(lhs, rhs);
+    };
+    const fds = fd.detectAll();
+
+    expect(fds).toContainEqual({ lhs: ['id'], rhs: 'name', confidence: 1 });
+    const pairsWithId = tested.filter(t => t.rhs === 'name' && t.lhs.length === 2 && t.lhs.includes('id'));
+    expect(pairsWithId).toEqual([]);
+    expect(fds.some(d => d.rhs === 'name' && d.lhs.length === 2 && d.lhs.includes('id'))).toBe(false);
+  });
+
+  test('removeRedundant drops FDs whose LHS is a proper superset', () => {
+    const fd = new FunctionalDependency(sampleData);
+    const fds = [
+      { lhs: ['id'], rhs: 'name' },
+      { lhs: ['id', 'dept'], rhs: 'name' },
+      { lhs: ['name', 'dept'], rhs: 'id' }
+    ];
+    const result = fd.removeRedundant(fds);
+    expect(result).toContainEqual({ lhs: ['id'], rhs: 'name' });
+    expect(result).toContainEqual({ lhs: ['name', 'dept'], rhs: 'id' });
+    expect(result.length).toBe(2);
+  });
+
   test('computes attribute closure', () => {
     const allFds = [
       { lhs: ['A'], rhs: 'B' },
@@ -37,4 +121,51 @@ describe('FunctionalDependency', () => {
     expect(closure).toContain('B');
     expect(closure).toContain('C');
   });
+
+  test('keeps closing when the seed or FDs reach outside allAttributes', () => {
+    const seedOutside = FunctionalDependency.computeClosure(
+      ['A', 'X'], ['A', 'B'], [{ lhs: ['A'], rhs: 'B' }]
+    );
+    expect(seedOutside.sort()).toEqual(['A', 'B', 'X']);
+
+    const rhsOutside = FunctionalDependency.computeClosure(
+      ['a'], ['a'], [{ lhs: ['a'], rhs: 'q' }]
+    );
+    expect(rhsOutside.sort()).toEqual(['a', 'q']);
+
+    expect(FunctionalDependency.computeClosure(['z'], ['a'], [{ lhs: ['z'], rhs: 'a' }]).sort())
+      .toEqual(['a', 'z']);
+  });
+
+  test('reuses a prepared LinClosure index across closures', () => {
+    const allFds = [
+      { lhs: ['A', 'B'], rhs: 'C' },
+      { lhs: ['C'], rhs: 'D' }
+    ];
+    const prepared = FunctionalDependency.prepareLinClosure(allFds);
+    const attrs = ['A', 'B', 'C', 'D'];
+    expect(FunctionalDependency.computeClosure(['A'], attrs, allFds, prepared)).toEqual(['A']);
+    expect(FunctionalDependency.computeClosure(['A', 'B'], attrs, allFds, prepared).length).toBe(4);
+  });
+
+  test('mask encoder rejects attributes it has no bit for', () => {
+    const narrow = FunctionalDependency.maskEncoder(['A', 'B']);
+    expect(narrow.mask(['A', 'B'])).toBe(3);
+    expect(() => narrow.bit('Z')).toThrow('Attribute Z is not in the encoded attribute set');
+    const wide = FunctionalDependency.maskEncoder(Array.from({ length: 40 }, (_, i) => `c${i}`));
+    expect(wide.bit('c35')).toBe(1n << 35n);
+    expect(() => wide.mask(['c0', 'Z'])).toThrow('Attribute Z is not in the encoded attribute set');
+  });
+
+  test('computes closures over attribute positions with the typed kernel', () => {
+    const allFds = [
+      { lhs: ['A', 'B'], rhs: 'C' },
+      { lhs: ['C'], rhs: 'D' }
+    ];
+    const kernel = FunctionalDependency.prepareClosureKernel(allFds, ['A', 'B', 'C', 'D']);
+    expect(FunctionalDependency.closureOfIndices([0], kernel).size).toBe(1);
+    const { inClosure, size } = FunctionalDependency.closureOfIndices([0, 1], kernel);
+    expect(size).toBe(4);
+    expect(Array.from(inClosure)).toEqual([1, 1, 1, 1]);
+  });
 });
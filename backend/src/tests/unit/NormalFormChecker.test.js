@@ -0,0 +1,92 @@
+// backend/src/__tests__/unit/NormalFormChecker.test.js
+
+import NormalFormChecker from '../../services/normalization/NormalFormChecker.js';
+
+describe('NormalFormChecker', () => {
+  const schema = { tableName: 'enrollments', attributes: ['id', 'name'] };
+  const checker = new NormalFormChecker(schema, [], [['id', 'name']]);
+
+  test('checks 1NF over row objects', () => {
+    expect(checker.check1NF([{ id: 1, name: 'Alice' }]).satisfied).toBe(true);
+    const result = checker.check1NF([{ id: 1, name: ['Alice', 'Bob'] }]);
+    expect(result.satisfied).toBe(false);
+    expect(result.violations).toEqual(['Attribute name contains non-atomic value']);
+  });
+
+  test('treats row arrays carrying a .columns header list as rows', () => {
+    // d3-dsv csvParse returns rows with the header names attached as .columns
+    const rows = [{ id: 1, name: { first: 'Alice' } }];
+    rows.columns = ['id', 'name'];
+    expect(checker.check1NF(rows).satisfied).toBe(false);
+  });
+
+  test('checks 1NF over columnar data', () => {
+    const atomic = { columns: { id: Int32Array.of(1, 2), name: ['Alice', null] } };
+    expect(checker.check1NF(atomic).satisfied).toBe(true);
+
+    const nested = { columns: { id: Int32Array.of(1, 2), name: ['Alice', { first: 'Bob' }] } };
+    const result = checker.check1NF(nested);
+    expect(result.satisfied).toBe(false);
+    expect(result.violations).toEqual(['Attribute name contains non-atomic value']);
+  });
+
+  test('reports 2NF and 3NF violations on an enrollment schema', () => {
+    const enrollment = {
+      tableName: 'enrollment',
+      attributes: ['StudentID', 'CourseID', 'StudentName', 'Instructor', 'Office', 'Grade']
+    };
+    const fds = [
+      { lhs: ['StudentID'], rhs: 'StudentName' }, // prime RHS: neither kind
+      { lhs: ['CourseID'], rhs: 'Instructor' },
+      { lhs: ['Instructor'], rhs: 'Office' },
+      { lhs: ['StudentID', 'CourseID'], rhs: 'Grade' },
+      { lhs: ['StudentName'], rhs: 'StudentID' }
+    ];
+    const keys = [['StudentID', 'CourseID'], ['StudentName', 'CourseID']];
+    const checker = new NormalFormChecker(enrollment, fds, keys);
+
+    expect(checker.check2NF()).toEqual({
+      satisfied: false,
+      violations: [{
+        lhs: ['CourseID'],
+        rhs: 'Instructor',
+        reason: 'Instructor partially depends on CourseID'
+      }]
+    });
+    expect(checker.check3NF()).toEqual({
+      satisfied: false,
+      violations: [{
+        lhs: ['Instructor'],
+        rhs: 'Office',
+        reason: 'Office transitively depends on Instructor'
+      }]
+    });
+  });
+
+  // Number masks up to 30 attributes, BigInt masks beyond
+  const schemas = {
+    narrow: ['a', 'b', 'c'],
+    wide: ['a', 'b', 'c', ...Array.from({ length: 33 }, (_, i) => `w${i}`)]
+  };
+
+  test('reports 2NF and 3NF as satisfied when there are no FDs', () => {
+    const noFds = new NormalFormChecker(schema, [], [schema.attributes]);
+    expect(noFds.check2NF().satisfied).toBe(true);
+    expect(noFds.check3NF().satisfied).toBe(true);
+  });
+
+  for (const [width, attributes] of Object.entries(schemas)) {
+    const outsideSchema = { tableName: 't', attributes };
+
+    test(`does not mistake an out-of-schema LHS attribute for a prime one (${width})`, () => {
+      const checker = new NormalFormChecker(outsideSchema, [{ lhs: ['x'], rhs: 'c' }], [['a', 'b']]);
+      expect(checker.check2NF().satisfied).toBe(true);
+      expect(checker.check3NF().violations.map(v => v.rhs)).toEqual(['c']);
+    });
+
+    test(`finds partial dependencies on keys with out-of-schema attributes (${width})`, () => {
+      const checker = new NormalFormChecker(outsideSchema, [{ lhs: ['a'], rhs: 'c' }], [['a', 'z']]);
+      expect(checker.check2NF().violations.map(v => v.rhs)).toEqual(['c']);
+    });
+  }
+});
@@ -96,4 +96,37 @@ describe('SchemaDecomposer', () => {
     expect(demoTable.attributes).toContain('Gender');
     expect(demoTable.attributes).toContain('IncomeLevel');
   });
+
+  test('grouping by determinant does not reorder shared FD LHS arrays', () => {
+    const fds = [
+      { lhs: ['StudentName', 'CourseID'], rhs: 'Grade' },
+      { lhs: ['CourseID', 'StudentName'], rhs: 'Semester' }
+    ];
+    const schema = { tableName: 'enrollment', attributes: ['StudentID', 'CourseID', 'StudentName', 'Grade', 'Semester'] };
+    const decomposer = new SchemaDecomposer(schema, fds, [['StudentID', 'CourseID', 'StudentName']]);
+    const res = decomposer.decomposeTo2NF();
+    const split = res.tables.find(t => t.attributes.includes('Grade') && t.attributes.includes('Semester'));
+    expect(split).toBeDefined();
+    expect(split.primaryKey).toEqual(['CourseID', 'StudentName']);
+    expect(fds[0].lhs).toEqual(['StudentName', 'CourseID']);
+  });
+
+  test('keeps the original table through every stage when there are no FDs', () => {
+    const schema = { tableName: 'people', attributes: ['id', 'name'] };
+    const { stages } = new SchemaDecomposer(schema, [], [['id', 'name']]).normalizeComplete();
+    const table = { name: 'people', attributes: ['id', 'name'], primaryKey: ['id', 'name'], foreignKeys: [] };
+    expect(stages[1].tables).toEqual([table]);
+    expect(stages[1].transformations).toEqual([
+      { type: '2NF', description: 'Removed partial dependencies', changes: [] }
+    ]);
+    expect(stages[2].tables).toEqual([table]);
+    expect(stages[2].transformations).toEqual([]);
+  });
+
+  test('decomposes wide schemas whose FDs name attributes outside the schema', () => {
+    const fds = [...tvFds, { lhs: ['ExternalRef'], rhs: 'AgeGroup' }];
+    const decomposer = new SchemaDecomposer(tvSchema, fds, [['NetworkID', 'ChannelID', 'ProgramID']]);
+    const { stages } = decomposer.normalizeComplete();
+    expect(stages.map(s => s.normalForm)).toEqual(['1NF', '2NF', '3NF']);
+  });
 });
@@ -47,7 +47,7 @@ function App() {
         {/* Show storyboard and table details after upload */}
         {normalizationResult && stages.length > 0 && (
           <ScrollStory data={normalizationResult}>
-            {/* UNF → 1NF D3 animation */}
+            {/* UNF → 1NF canvas animation */}
             <RowToEntityMorph
               data={dataset?.rows}
               isActive={true}
@@ -1,201 +1,204 @@
 
 // frontend/src/visualizations/RowToEntityMorph.jsx
 import React, { useEffect, useRef } from 'react';
-import * as d3 from 'd3';
-import { gsap } from 'gsap';
 
 /**
  * RowToEntityMorph - Animates UNF → 1NF transformation
  * Shows rows with nested/multi-valued attributes "exploding" into atomic rows
+ *
+ * Rendered immediate-mode on a 2D canvas: each frame is one clear plus a
+ * few dozen fill calls, with no DOM nodes to restyle or re-layout.
  */
+
+const WIDTH = 800;
+const HEIGHT = 600;
+const HOLD_MS = 2000;
+
+// Easing curves matching the GSAP/d3 defaults the animation was tuned with
+const power1Out = u => 1 - (1 - u) ** 2;
+const cubicInOut = u => (u < 0.5 ? 4 * u ** 3 : 1 - (-2 * u + 2) ** 3 / 2);
+// back.out(1.7): overshoots slightly, then settles
+const backOut = (u, s = 1.7) => 1 + (s + 1) * (u - 1) ** 3 + s * (u - 1) ** 2;
+
+const clamp01 = v => Math.min(1, Math.max(0, v));
+
+// Sample UNF data (rows with multi-valued attributes)
+const UNF_DATA = Object.freeze([
+  { id: 1, student: 'Alice', courses: ['CS101', 'CS102', 'MATH201'] },
+  { id: 2, student: 'Bob', courses: ['CS101', 'PHYS101'] },
+  { id: 3, student: 'Carol', courses: ['MATH201'] }
+]);
+
+// Flatten to 1NF (one course per row)
+const NF_DATA = Object.freeze(UNF_DATA.flatMap(row =>
+  row.courses.map(course => ({
+    id: row.id,
+    student: row.student,
+    course
+  }))
+));
+
+const span = (start, duration, ease) => ({ start, end: start + duration, ease });
+
+/**
+ * Keyframes for every shape, in ms since mount, computed once:
+ * - UNF rows fade to 0.3 opacity (staggered 100ms)
+ * - course bubbles shrink away, overlapping the last 500ms of the fade
+ * - flattened 1NF rows pop in one after another
+ * - the arrow fades in 1s after the hold ends
+ */
+const TIMELINE = (() => {
+  const rows = UNF_DATA.map((_, i) => span(HOLD_MS + i * 100, 1000, power1Out));
+  const rowsEnd = rows[rows.length - 1].end;
+
+  let k = 0;
+  const bubbles = UNF_DATA.map(row =>
+    row.courses.map(() => span(rowsEnd - 500 + 50 * k++, 500, power1Out))
+  );
+  const bubblesEnd = rowsEnd + 50 * (k - 1);
+
+  const nfRows = NF_DATA.map((_, i) => span(bubblesEnd + i * 100, 800, backOut));
+  const arrow = span(HOLD_MS + 1000, 500, cubicInOut);
+
+  const end = Math.max(nfRows[nfRows.length - 1].end, arrow.end);
+  return { rows, bubbles, nfRows, arrow, end };
+})();
+
+// Eased progress of a keyframe span at the given time (0 before, 1 after)
+const progress = ({ start, end, ease }, elapsed) =>
+  ease(clamp01((elapsed - start) / (end - start)));
+
+function roundedRect(ctx, x, y, w, h, r, fill, stroke, lineWidth) {
+  ctx.beginPath();
+  ctx.moveTo(x + r, y);
+  ctx.arcTo(x + w, y, x + w, y + h, r);
+  ctx.arcTo(x + w, y + h, x, y + h, r);
+  ctx.arcTo(x, y + h, x, y, r);
+  ctx.arcTo(x, y, x + w, y, r);
+  ctx.closePath();
+  ctx.fillStyle = fill;
+  ctx.fill();
+  ctx.strokeStyle = stroke;
+  ctx.lineWidth = lineWidth;
+  ctx.stroke();
+}
+
+function label(ctx, text, x, y, font) {
+  ctx.font = font;
+  ctx.fillStyle = 'white';
+  ctx.textAlign = 'center';
+  ctx.fillText(text, x, y);
+}
+
+/**
+ * Draw the whole scene as it looks `elapsed` ms after mount
+ */
+function draw(ctx, elapsed) {
+  const dpr = window.devicePixelRatio || 1;
+  ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+  ctx.globalAlpha = 1;
+  ctx.clearRect(0, 0, WIDTH, HEIGHT);
+  ctx.translate(50, 50);
+
+  // UNF rows (student + nested course bubbles)
+  const rowHeight = 80;
+  UNF_DATA.forEach((row, i) => {
+    const y = i * rowHeight;
+    const fade = 1 - 0.7 * progress(TIMELINE.rows[i], elapsed);
+    ctx.globalAlpha = fade;
+    roundedRect(ctx, 0, y, 100, 60, 5, '#4A90E2', '#2E5C8A', 2);
+    label(ctx, row.student, 50, y + 35, 'bold 14px sans-serif');
+
+    // Bubbles sit inside the row, so they fade with it while shrinking
+    row.courses.forEach((course, j) => {
+      const scale = 1 - progress(TIMELINE.bubbles[i][j], elapsed);
+      if (scale <= 0) return;
+      const cx = 150 + j * 60;
+      ctx.globalAlpha = 0.8 * fade;
+      ctx.beginPath();
+      ctx.arc(cx, y + 30, 25 * scale, 0, 2 * Math.PI);
+      ctx.fillStyle = '#FF6B6B';
+      ctx.fill();
+      ctx.strokeStyle = '#C92A2A';
+      ctx.lineWidth = 2;
+      ctx.stroke();
+      label(ctx, course, cx, y + 30 + 5 * scale, `${10 * scale}px sans-serif`);
+    });
+  });
+
+  // Flattened 1NF rows (one course per row)
+  NF_DATA.forEach((row, i) => {
+    const pop = progress(TIMELINE.nfRows[i], elapsed);
+    if (pop <= 0) return;
+    ctx.globalAlpha = Math.min(1, pop);
+    const y = i * 50;
+    roundedRect(ctx, 450, y, 80, 40, 3, '#4A90E2', '#2E5C8A', 1);
+    label(ctx, row.student, 490, y + 25, '12px sans-serif');
+    roundedRect(ctx, 535, y, 80, 40, 3, '#51CF66', '#2B8A3E', 1);
+    label(ctx, row.course, 575, y + 25, '12px sans-serif');
+  });
+
+  // Arrow showing transformation
+  const arrow = progress(TIMELINE.arrow, elapsed);
+  if (arrow <= 0) return;
+  ctx.globalAlpha = arrow;
+  ctx.strokeStyle = '#333';
+  ctx.fillStyle = '#333';
+  ctx.lineWidth = 3;
+  ctx.beginPath();
+  ctx.moveTo(380, 150);
+  ctx.lineTo(422, 150);
+  ctx.stroke();
+  ctx.beginPath();
+  ctx.moveTo(420, 141);
+  ctx.lineTo(438, 150);
+  ctx.lineTo(420, 159);
+  ctx.closePath();
+  ctx.fill();
+}
+
 const RowToEntityMorph = ({ data, isActive }) => {
-  const svgRef = useRef();
+  const canvasRef = useRef();
   const containerRef = useRef();
+  const ctxRef = useRef(null);
 
+  // One-time canvas setup: back it with device pixels so shapes and text
+  // stay crisp, and keep the 2D context for every later effect run
   useEffect(() => {
-    if (!data || !isActive) return;
+    const canvas = canvasRef.current;
+    const dpr = window.devicePixelRatio || 1;
+    canvas.width = WIDTH * dpr;
+    canvas.height = HEIGHT * dpr;
+    canvas.style.width = `${WIDTH}px`;
+    canvas.style.height = `${HEIGHT}px`;
+    ctxRef.current = canvas.getContext('2d');
+  }, []);
 
-    const container = d3.select(containerRef.current);
-    const svg = d3.select(svgRef.current);
-    const width = 800;
-    const height = 600;
-
-    svg.attr('width', width).attr('height', height);
-
-    // Clear previous visualization
-    svg.selectAll('*').remove();
-
-    // Create main group
-    const g = svg.append('g').attr('transform', 'translate(50, 50)');
-
-    // Sample UNF data (rows with multi-valued attributes)
-    const unfData = [
-      { id: 1, student: 'Alice', courses: ['CS101', 'CS102', 'MATH201'] },
-      { id: 2, student: 'Bob', courses: ['CS101', 'PHYS101'] },
-      { id: 3, student: 'Carol', courses: ['MATH201'] }
-    ];
-
-    // Flatten to 1NF (one course per row)
-    const nfData = unfData.flatMap(row => 
-      row.courses.map(course => ({
-        id: row.id,
-        student: row.student,
-        course
-      }))
-    );
-
-    // Draw UNF rows (grouped with nested courses)
-    const rowHeight = 80;
-    const unfRows = g.selectAll('.unf-row')
-      .data(unfData)
-      .enter()
-      .append('g')
-      .attr('class', 'unf-row')
-      .attr('transform', (d, i) => `translate(0, ${i * rowHeight})`);
-
-    // Student names
-    unfRows.append('rect')
-      .attr('width', 100)
-      .attr('height', 60)
-      .attr('fill', '#4A90E2')
-      .attr('stroke', '#2E5C8A')
-      .attr('stroke-width', 2)
-      .attr('rx', 5);
-
-    unfRows.append('text')
-      .attr('x', 50)
-      .attr('y', 35)
-      .attr('text-anchor', 'middle')
-      .attr('fill', 'white')
-      .attr('font-size', 14)
-      .attr('font-weight', 'bold')
-      .text(d => d.student);
-
-    // Multi-valued courses (nested bubble)
-    unfRows.selectAll('.course-bubble')
-      .data(d => d.courses.map(c => ({ student: d.student, course: c })))
-      .enter()
-      .append('g')
-      .attr('class', 'course-bubble')
-      .each(function(d, i) {
-        const bubble = d3.select(this);
-
-        bubble.append('circle')
-          .attr('cx', 150 + i * 60)
-          .attr('cy', 30)
-          .attr('r', 25)
-          .attr('fill', '#FF6B6B')
-          .attr('stroke', '#C92A2A')
-          .attr('stroke-width', 2)
-          .attr('opacity', 0.8);
-
-        bubble.append('text')
-          .attr('x', 150 + i * 60)
-          .attr('y', 35)
-          .attr('text-anchor', 'middle')
-          .attr('fill', 'white')
-          .attr('font-size', 10)
-          .text(d.course);
-      });
-
-    // Animate transformation to 1NF after 2 seconds
-    setTimeout(() => {
-      // Calculate new positions for flattened rows
-      const flattenedRows = g.selectAll('.flattened-row')
-        .data(nfData)
-        .enter()
-        .append('g')
-        .attr('class', 'flattened-row')
-        .attr('transform', (d, i) => `translate(450, ${i * 50})`)
-        .attr('opacity', 0);
-
-      // Student cell
-      flattenedRows.append('rect')
-        .attr('width', 80)
-        .attr('height', 40)
-        .attr('fill', '#4A90E2')
-        .attr('stroke', '#2E5C8A')
-        .attr('stroke-width', 1)
-        .attr('rx', 3);
-
-      flattenedRows.append('text')
-        .attr('x', 40)
-        .attr('y', 25)
-        .attr('text-anchor', 'middle')
-        .attr('fill', 'white')
-        .attr('font-size', 12)
-        .text(d => d.student);
-
-      // Course cell
-      flattenedRows.append('rect')
-        .attr('x', 85)
-        .attr('width', 80)
-        .attr('height', 40)
-        .attr('fill', '#51CF66')
-        .attr('stroke', '#2B8A3E')
-        .attr('stroke-width', 1)
-        .attr('rx', 3);
-
-      flattenedRows.append('text')
-        .attr('x', 125)
-        .attr('y', 25)
-        .attr('text-anchor', 'middle')
-        .attr('fill', 'white')
-        .attr('font-size', 12)
-        .text(d => d.course);
-
-      // GSAP animation: fade out UNF, fade in 1NF
-      const tl = gsap.timeline();
-
-      tl.to('.unf-row', {
-        opacity: 0.3,
-        duration: 1,
-        stagger: 0.1
-      })
-      .to('.course-bubble', {
-        scale: 0,
-        duration: 0.5,
-        stagger: 0.05
-      }, '-=0.5')
-      .to('.flattened-row', {
-        opacity: 1,
-        duration: 0.8,
-        stagger: 0.1,
-        ease: 'back.out(1.7)'
-      });
-
-      // Add arrow showing transformation
-      g.append('path')
-        .attr('d', 'M 380 150 L 430 150')
-        .attr('stroke', '#333')
-        .attr('stroke-width', 3)
-        .attr('marker-end', 'url(#arrowhead)')
-        .attr('opacity', 0)
-        .transition()
-        .delay(1000)
-        .duration(500)
-        .attr('opacity', 1);
-
-      // Define arrowhead marker
-      svg.append('defs')
-        .append('marker')
-        .attr('id', 'arrowhead')
-        .attr('markerWidth', 10)
-        .attr('markerHeight', 10)
-        .attr('refX', 9)
-        .attr('refY', 3)
-        .attr('orient', 'auto')
-        .append('polygon')
-        .attr('points', '0 0, 10 3, 0 6')
-        .attr('fill', '#333');
-
-    }, 2000);
+  useEffect(() => {
+    if (!data || !isActive) return;
 
+    const ctx = ctxRef.current;
+    draw(ctx, 0);
+
+    // Single frame loop over the precomputed timeline; the scene is static
+    // during the initial hold, so frames before it only reschedule
+    const start = performance.now();
+    let frame = null;
+    const tick = now => {
+      const elapsed = now - start;
+      if (elapsed >= HOLD_MS) draw(ctx, elapsed);
+      frame = elapsed < TIMELINE.end ? requestAnimationFrame(tick) : null;
+    };
+    frame = requestAnimationFrame(tick);
+
+    return () => {
+      if (frame !== null) cancelAnimationFrame(frame);
+    };
   }, [data, isActive]);
 
   return (
     <div ref={containerRef} className="visualization-container">
-      <svg ref={svgRef}></svg>
+      <canvas ref={canvasRef} width={WIDTH} height={HEIGHT}></canvas>
       <div className="viz-caption">
         <h3>UNF → 1NF: Atomicity</h3>
         <p>Multi-valued attributes (courses) split into separate rows. Each cell now contains a single atomic value.</p>
@@ -1,6 +1,8 @@
 
 # Generate VIVA DEFENSE script and core React visualization components
 
+from pathlib import Path
+
 viva_defense = """# NormalDB: Viva Defense Script
 
 ## Executive Summary
@@ -280,8 +282,7 @@ For educational use and medium databases (<1M rows), it's production-ready.
 Good luck! Remember: You built something genuinely impressive. Own it. 💪
 """
 
-with open('VIVA_DEFENSE.md', 'w') as f:
-    f.write(viva_defense)
+Path('VIVA_DEFENSE.md').write_bytes(viva_defense.encode('utf-8'))
 
 print("✅ Viva Defense Script generated!")
 print("   - VIVA_DEFENSE.md created with complete academic defense")
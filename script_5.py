@@ -1,205 +1,210 @@
 
-# Generate React D3 visualization components and database initialization
+# Generate React canvas visualization components and database initialization
+
+import os
 
 # React visualization component - UNF to 1NF animation
 unf_to_1nf_viz = """
 // frontend/src/visualizations/RowToEntityMorph.jsx
 import React, { useEffect, useRef } from 'react';
-import * as d3 from 'd3';
-import { gsap } from 'gsap';
 
 /**
  * RowToEntityMorph - Animates UNF → 1NF transformation
  * Shows rows with nested/multi-valued attributes "exploding" into atomic rows
+ *
+ * Rendered immediate-mode on a 2D canvas: each frame is one clear plus a
+ * few dozen fill calls, with no DOM nodes to restyle or re-layout.
+ */
+
+const WIDTH = 800;
+const HEIGHT = 600;
+const HOLD_MS = 2000;
+
+// Easing curves matching the GSAP/d3 defaults the animation was tuned with
+const power1Out = u => 1 - (1 - u) ** 2;
+const cubicInOut = u => (u < 0.5 ? 4 * u ** 3 : 1 - (-2 * u + 2) ** 3 / 2);
+// back.out(1.7): overshoots slightly, then settles
+const backOut = (u, s = 1.7) => 1 + (s + 1) * (u - 1) ** 3 + s * (u - 1) ** 2;
+
+const clamp01 = v => Math.min(1, Math.max(0, v));
+
+// Sample UNF data (rows with multi-valued attributes)
+const UNF_DATA = Object.freeze([
+  { id: 1, student: 'Alice', courses: ['CS101', 'CS102', 'MATH201'] },
+  { id: 2, student: 'Bob', courses: ['CS101', 'PHYS101'] },
+  { id: 3, student: 'Carol', courses: ['MATH201'] }
+]);
+
+// Flatten to 1NF (one course per row)
+const NF_DATA = Object.freeze(UNF_DATA.flatMap(row =>
+  row.courses.map(course => ({
+    id: row.id,
+    student: row.student,
+    course
+  }))
+));
+
+const span = (start, duration, ease) => ({ start, end: start + duration, ease });
+
+/**
+ * Keyframes for every shape, in ms since mount, computed once:
+ * - UNF rows fade to 0.3 opacity (staggered 100ms)
+ * - course bubbles shrink away, overlapping the last 500ms of the fade
+ * - flattened 1NF rows pop in one after another
+ * - the arrow fades in 1s after the hold ends
  */
+const TIMELINE = (() => {
+  const rows = UNF_DATA.map((_, i) => span(HOLD_MS + i * 100, 1000, power1Out));
+  const rowsEnd = rows[rows.length - 1].end;
+
+  let k = 0;
+  const bubbles = UNF_DATA.map(row =>
+    row.courses.map(() => span(rowsEnd - 500 + 50 * k++, 500, power1Out))
+  );
+  const bubblesEnd = rowsEnd + 50 * (k - 1);
+
+  const nfRows = NF_DATA.map((_, i) => span(bubblesEnd + i * 100, 800, backOut));
+  const arrow = span(HOLD_MS + 1000, 500, cubicInOut);
+
+  const end = Math.max(nfRows[nfRows.length - 1].end, arrow.end);
+  return { rows, bubbles, nfRows, arrow, end };
+})();
+
+// Eased progress of a keyframe span at the given time (0 before, 1 after)
+const progress = ({ start, end, ease }, elapsed) =>
+  ease(clamp01((elapsed - start) / (end - start)));
+
+function roundedRect(ctx, x, y, w, h, r, fill, stroke, lineWidth) {
+  ctx.beginPath();
+  ctx.moveTo(x + r, y);
+  ctx.arcTo(x + w, y, x + w, y + h, r);
+  ctx.arcTo(x + w, y + h, x, y + h, r);
+  ctx.arcTo(x, y + h, x, y, r);
+  ctx.arcTo(x, y, x + w, y, r);
+  ctx.closePath();
+  ctx.fillStyle = fill;
+  ctx.fill();
+  ctx.strokeStyle = stroke;
+  ctx.lineWidth = lineWidth;
+  ctx.stroke();
+}
+
+function label(ctx, text, x, y, font) {
+  ctx.font = font;
+  ctx.fillStyle = 'white';
+  ctx.textAlign = 'center';
+  ctx.fillText(text, x, y);
+}
+
+/**
+ * Draw the whole scene as it looks `elapsed` ms after mount
+ */
+function draw(ctx, elapsed) {
+  const dpr = window.devicePixelRatio || 1;
+  ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+  ctx.globalAlpha = 1;
+  ctx.clearRect(0, 0, WIDTH, HEIGHT);
+  ctx.translate(50, 50);
+
+  // UNF rows (student + nested course bubbles)
+  const rowHeight = 80;
+  UNF_DATA.forEach((row, i) => {
+    const y = i * rowHeight;
+    const fade = 1 - 0.7 * progress(TIMELINE.rows[i], elapsed);
+    ctx.globalAlpha = fade;
+    roundedRect(ctx, 0, y, 100, 60, 5, '#4A90E2', '#2E5C8A', 2);
+    label(ctx, row.student, 50, y + 35, 'bold 14px sans-serif');
+
+    // Bubbles sit inside the row, so they fade with it while shrinking
+    row.courses.forEach((course, j) => {
+      const scale = 1 - progress(TIMELINE.bubbles[i][j], elapsed);
+      if (scale <= 0) return;
+      const cx = 150 + j * 60;
+      ctx.globalAlpha = 0.8 * fade;
+      ctx.beginPath();
+      ctx.arc(cx, y + 30, 25 * scale, 0, 2 * Math.PI);
+      ctx.fillStyle = '#FF6B6B';
+      ctx.fill();
+      ctx.strokeStyle = '#C92A2A';
+      ctx.lineWidth = 2;
+      ctx.stroke();
+      label(ctx, course, cx, y + 30 + 5 * scale, `${10 * scale}px sans-serif`);
+    });
+  });
+
+  // Flattened 1NF rows (one course per row)
+  NF_DATA.forEach((row, i) => {
+    const pop = progress(TIMELINE.nfRows[i], elapsed);
+    if (pop <= 0) return;
+    ctx.globalAlpha = Math.min(1, pop);
+    const y = i * 50;
+    roundedRect(ctx, 450, y, 80, 40, 3, '#4A90E2', '#2E5C8A', 1);
+    label(ctx, row.student, 490, y + 25, '12px sans-serif');
+    roundedRect(ctx, 535, y, 80, 40, 3, '#51CF66', '#2B8A3E', 1);
+    label(ctx, row.course, 575, y + 25, '12px sans-serif');
+  });
+
+  // Arrow showing transformation
+  const arrow = progress(TIMELINE.arrow, elapsed);
+  if (arrow <= 0) return;
+  ctx.globalAlpha = arrow;
+  ctx.strokeStyle = '#333';
+  ctx.fillStyle = '#333';
+  ctx.lineWidth = 3;
+  ctx.beginPath();
+  ctx.moveTo(380, 150);
+  ctx.lineTo(422, 150);
+  ctx.stroke();
+  ctx.beginPath();
+  ctx.moveTo(420, 141);
+  ctx.lineTo(438, 150);
+  ctx.lineTo(420, 159);
+  ctx.closePath();
+  ctx.fill();
+}
+
 const RowToEntityMorph = ({ data, isActive }) => {
-  const svgRef = useRef();
+  const canvasRef = useRef();
   const containerRef = useRef();
+  const ctxRef = useRef(null);
 
+  // One-time canvas setup: back it with device pixels so shapes and text
+  // stay crisp, and keep the 2D context for every later effect run
   useEffect(() => {
-    if (!data || !isActive) return;
+    const canvas = canvasRef.current;
+    const dpr = window.devicePixelRatio || 1;
+    canvas.width = WIDTH * dpr;
+    canvas.height = HEIGHT * dpr;
+    canvas.style.width = `${WIDTH}px`;
+    canvas.style.height = `${HEIGHT}px`;
+    ctxRef.current = canvas.getContext('2d');
+  }, []);
 
-    const container = d3.select(containerRef.current);
-    const svg = d3.select(svgRef.current);
-    const width = 800;
-    const height = 600;
-
-    svg.attr('width', width).attr('height', height);
-
-    // Clear previous visualization
-    svg.selectAll('*').remove();
-
-    // Create main group
-    const g = svg.append('g').attr('transform', 'translate(50, 50)');
-
-    // Sample UNF data (rows with multi-valued attributes)
-    const unfData = [
-      { id: 1, student: 'Alice', courses: ['CS101', 'CS102', 'MATH201'] },
-      { id: 2, student: 'Bob', courses: ['CS101', 'PHYS101'] },
-      { id: 3, student: 'Carol', courses: ['MATH201'] }
-    ];
-
-    // Flatten to 1NF (one course per row)
-    const nfData = unfData.flatMap(row => 
-      row.courses.map(course => ({
-        id: row.id,
-        student: row.student,
-        course
-      }))
-    );
-
-    // Draw UNF rows (grouped with nested courses)
-    const rowHeight = 80;
-    const unfRows = g.selectAll('.unf-row')
-      .data(unfData)
-      .enter()
-      .append('g')
-      .attr('class', 'unf-row')
-      .attr('transform', (d, i) => `translate(0, ${i * rowHeight})`);
-
-    // Student names
-    unfRows.append('rect')
-      .attr('width', 100)
-      .attr('height', 60)
-      .attr('fill', '#4A90E2')
-      .attr('stroke', '#2E5C8A')
-      .attr('stroke-width', 2)
-      .attr('rx', 5);
-
-    unfRows.append('text')
-      .attr('x', 50)
-      .attr('y', 35)
-      .attr('text-anchor', 'middle')
-      .attr('fill', 'white')
-      .attr('font-size', 14)
-      .attr('font-weight', 'bold')
-      .text(d => d.student);
-
-    // Multi-valued courses (nested bubble)
-    unfRows.selectAll('.course-bubble')
-      .data(d => d.courses.map(c => ({ student: d.student, course: c })))
-      .enter()
-      .append('g')
-      .attr('class', 'course-bubble')
-      .each(function(d, i) {
-        const bubble = d3.select(this);
-        
-        bubble.append('circle')
-          .attr('cx', 150 + i * 60)
-          .attr('cy', 30)
-          .attr('r', 25)
-          .attr('fill', '#FF6B6B')
-          .attr('stroke', '#C92A2A')
-          .attr('stroke-width', 2)
-          .attr('opacity', 0.8);
-
-        bubble.append('text')
-          .attr('x', 150 + i * 60)
-          .attr('y', 35)
-          .attr('text-anchor', 'middle')
-          .attr('fill', 'white')
-          .attr('font-size', 10)
-          .text(d.course);
-      });
-
-    // Animate transformation to 1NF after 2 seconds
-    setTimeout(() => {
-      // Calculate new positions for flattened rows
-      const flattenedRows = g.selectAll('.flattened-row')
-        .data(nfData)
-        .enter()
-        .append('g')
-        .attr('class', 'flattened-row')
-        .attr('transform', (d, i) => `translate(450, ${i * 50})`)
-        .attr('opacity', 0);
-
-      // Student cell
-      flattenedRows.append('rect')
-        .attr('width', 80)
-        .attr('height', 40)
-        .attr('fill', '#4A90E2')
-        .attr('stroke', '#2E5C8A')
-        .attr('stroke-width', 1)
-        .attr('rx', 3);
-
-      flattenedRows.append('text')
-        .attr('x', 40)
-        .attr('y', 25)
-        .attr('text-anchor', 'middle')
-        .attr('fill', 'white')
-        .attr('font-size', 12)
-        .text(d => d.student);
-
-      // Course cell
-      flattenedRows.append('rect')
-        .attr('x', 85)
-        .attr('width', 80)
-        .attr('height', 40)
-        .attr('fill', '#51CF66')
-        .attr('stroke', '#2B8A3E')
-        .attr('stroke-width', 1)
-        .attr('rx', 3);
-
-      flattenedRows.append('text')
-        .attr('x', 125)
-        .attr('y', 25)
-        .attr('text-anchor', 'middle')
-        .attr('fill', 'white')
-        .attr('font-size', 12)
-        .text(d => d.course);
-
-      // GSAP animation: fade out UNF, fade in 1NF
-      const tl = gsap.timeline();
-      
-      tl.to('.unf-row', {
-        opacity: 0.3,
-        duration: 1,
-        stagger: 0.1
-      })
-      .to('.course-bubble', {
-        scale: 0,
-        duration: 0.5,
-        stagger: 0.05
-      }, '-=0.5')
-      .to('.flattened-row', {
-        opacity: 1,
-        duration: 0.8,
-        stagger: 0.1,
-        ease: 'back.out(1.7)'
-      });
-
-      // Add arrow showing transformation
-      g.append('path')
-        .attr('d', 'M 380 150 L 430 150')
-        .attr('stroke', '#333')
-        .attr('stroke-width', 3)
-        .attr('marker-end', 'url(#arrowhead)')
-        .attr('opacity', 0)
-        .transition()
-        .delay(1000)
-        .duration(500)
-        .attr('opacity', 1);
-
-      // Define arrowhead marker
-      svg.append('defs')
-        .append('marker')
-        .attr('id', 'arrowhead')
-        .attr('markerWidth', 10)
-        .attr('markerHeight', 10)
-        .attr('refX', 9)
-        .attr('refY', 3)
-        .attr('orient', 'auto')
-        .append('polygon')
-        .attr('points', '0 0, 10 3, 0 6')
-        .attr('fill', '#333');
-
-    }, 2000);
+  useEffect(() => {
+    if (!data || !isActive) return;
 
+    const ctx = ctxRef.current;
+    draw(ctx, 0);
+
+    // Single frame loop over the precomputed timeline; the scene is static
+    // during the initial hold, so frames before it only reschedule
+    const start = performance.now();
+    let frame = null;
+    const tick = now => {
+      const elapsed = now - start;
+      if (elapsed >= HOLD_MS) draw(ctx, elapsed);
+      frame = elapsed < TIMELINE.end ? requestAnimationFrame(tick) : null;
+    };
+    frame = requestAnimationFrame(tick);
+
+    return () => {
+      if (frame !== null) cancelAnimationFrame(frame);
+    };
   }, [data, isActive]);
 
   return (
     <div ref={containerRef} className="visualization-container">
-      <svg ref={svgRef}></svg>
+      <canvas ref={canvasRef} width={WIDTH} height={HEIGHT}></canvas>
       <div className="viz-caption">
         <h3>UNF → 1NF: Atomicity</h3>
         <p>Multi-valued attributes (courses) split into separate rows. Each cell now contains a single atomic value.</p>
@@ -216,6 +221,10 @@ tv_channel_schema = """
 -- database/init-scripts/03-seed-tv-channel-data.sql
 -- TV Channel Management System - Denormalized UNF Schema with Sample Data
 
+-- Table rebuild and seed load commit together; because the table is
+-- created in the same transaction, COPY can write the rows pre-frozen
+BEGIN;
+
 -- Drop existing tables if any
 DROP TABLE IF EXISTS tv_channel_data CASCADE;
 
@@ -286,125 +295,40 @@ CREATE TABLE tv_channel_data (
 );
 
 -- Insert sample data with intentional redundancy
-
--- Network: NewsFirst (ID: 1)
--- Channel: NewsFirst HD (ID: 101)
--- Program: Morning Brief (ID: 1001)
-INSERT INTO tv_channel_data VALUES
-(1, 'NewsFirst Network', 'Leading news broadcasting network', 
- 101, 'NewsFirst HD', 501, 'https://cdn.example.com/newsfirst_logo.png',
- 1001, 'Morning Brief', 'Daily morning news roundup', 'News', 'TV-G',
- NULL, NULL, NULL, NULL, NULL,
- 5001, '2024-01-15 06:00:00', '2024-01-15 08:00:00',
- 2001, 'AutoMax Commercial', 5, '2024-01-01', '2024-03-31',
- 3001, 'HD', 'https://stream.example.com/newsfirst_hd',
- 4001, '2024-01-15', 'Morning', 4.5, 'Adults 25-54',
- 6001, 7001, '123 Main St, Mumbai', 'Mumbai Metro', 'Urban',
- 8001, '25-34', 'Male', 'Middle'),
- 
-(1, 'NewsFirst Network', 'Leading news broadcasting network',
- 101, 'NewsFirst HD', 501, 'https://cdn.example.com/newsfirst_logo.png',
- 1001, 'Morning Brief', 'Daily morning news roundup', 'News', 'TV-G',
- NULL, NULL, NULL, NULL, NULL,
- 5002, '2024-01-16 06:00:00', '2024-01-16 08:00:00',
- 2001, 'AutoMax Commercial', 5, '2024-01-01', '2024-03-31',
- 3001, 'HD', 'https://stream.example.com/newsfirst_hd',
- 4002, '2024-01-16', 'Morning', 4.7, 'Adults 25-54',
- 6002, 7002, '456 Oak Ave, Delhi', 'Delhi NCR', 'Urban',
- 8002, '35-44', 'Female', 'Upper Middle');
-
--- Program: Prime Time News (ID: 1002)
-INSERT INTO tv_channel_data VALUES
-(1, 'NewsFirst Network', 'Leading news broadcasting network',
- 101, 'NewsFirst HD', 501, 'https://cdn.example.com/newsfirst_logo.png',
- 1002, 'Prime Time News', 'Evening news analysis', 'News', 'TV-PG',
- NULL, NULL, NULL, NULL, NULL,
- 5003, '2024-01-15 20:00:00', '2024-01-15 21:00:00',
- 2002, 'TechGadgets Ad', 3, '2024-01-01', '2024-06-30',
- 3001, 'HD', 'https://stream.example.com/newsfirst_hd',
- 4003, '2024-01-15', 'Prime Time', 8.2, 'Adults 25-54',
- 6003, 7003, '789 Park Rd, Bangalore', 'Bangalore', 'Urban',
- 8003, '45-54', 'Male', 'High');
-
--- Network: EntertainMax (ID: 2)
--- Channel: EntertainMax Gold (ID: 201)
--- Program: Drama Series - "The Family" (ID: 2001) with Episodes
-INSERT INTO tv_channel_data VALUES
-(2, 'EntertainMax', 'Premium entertainment channel network',
- 201, 'EntertainMax Gold', 601, 'https://cdn.example.com/entertainmax_logo.png',
- 2001, 'The Family', 'Drama series about a business family', 'Drama', 'TV-14',
- 10001, 'Pilot Episode', 'The family business faces a crisis', '2024-01-10', 45,
- 5004, '2024-01-10 21:00:00', '2024-01-10 21:45:00',
- 2003, 'Fashion Brand X', 4, '2024-01-01', '2024-12-31',
- 3002, 'HD', 'https://stream.example.com/entertainmax_hd',
- 4004, '2024-01-10', 'Prime Time', 6.8, 'Adults 18-49',
- 6004, 7004, '321 Lake View, Hyderabad', 'Hyderabad', 'Urban',
- 8004, '18-24', 'Female', 'Middle'),
-
-(2, 'EntertainMax', 'Premium entertainment channel network',
- 201, 'EntertainMax Gold', 601, 'https://cdn.example.com/entertainmax_logo.png',
- 2001, 'The Family', 'Drama series about a business family', 'Drama', 'TV-14',
- 10002, 'Episode 2: The Deal', 'A major business deal is negotiated', '2024-01-17', 45,
- 5005, '2024-01-17 21:00:00', '2024-01-17 21:45:00',
- 2003, 'Fashion Brand X', 4, '2024-01-01', '2024-12-31',
- 3002, 'HD', 'https://stream.example.com/entertainmax_hd',
- 4005, '2024-01-17', 'Prime Time', 7.1, 'Adults 18-49',
- 6005, 7005, '555 River St, Chennai', 'Chennai', 'Urban',
- 8005, '25-34', 'Male', 'Middle');
-
--- Program: Comedy Show - "Laugh Out Loud" (ID: 2002)
-INSERT INTO tv_channel_data VALUES
-(2, 'EntertainMax', 'Premium entertainment channel network',
- 201, 'EntertainMax Gold', 601, 'https://cdn.example.com/entertainmax_logo.png',
- 2002, 'Laugh Out Loud', 'Stand-up comedy show', 'Comedy', 'TV-MA',
- NULL, NULL, NULL, NULL, NULL,
- 5006, '2024-01-12 22:00:00', '2024-01-12 23:00:00',
- 2004, 'Beverage Co Ad', 6, '2024-01-01', '2024-02-29',
- 3002, 'HD', 'https://stream.example.com/entertainmax_hd',
- 4006, '2024-01-12', 'Late Night', 5.3, 'Adults 18-34',
- 6006, 7006, '888 Hill Top, Pune', 'Pune', 'Urban',
- 8006, '18-24', 'Male', 'Lower Middle');
-
--- Network: SportsZone (ID: 3)
--- Channel: SportsZone Live (ID: 301)
--- Program: Cricket Match Live (ID: 3001)
-INSERT INTO tv_channel_data VALUES
-(3, 'SportsZone', 'Sports broadcasting network',
- 301, 'SportsZone Live', 701, 'https://cdn.example.com/sportszone_logo.png',
- 3001, 'IPL Cricket Live', 'Live cricket match coverage', 'Sports', 'TV-G',
- NULL, NULL, NULL, NULL, NULL,
- 5007, '2024-01-14 19:00:00', '2024-01-14 23:00:00',
- 2005, 'Sports Shoes Ad', 8, '2024-01-01', '2024-04-30',
- 3003, 'HD', 'https://stream.example.com/sportszone_hd',
- 4007, '2024-01-14', 'Prime Time', 12.5, 'All Adults',
- 6007, 7007, '999 Stadium Rd, Kolkata', 'Kolkata', 'Urban',
- 8007, '25-34', 'Male', 'Middle'),
-
-(3, 'SportsZone', 'Sports broadcasting network',
- 301, 'SportsZone Live', 701, 'https://cdn.example.com/sportszone_logo.png',
- 3001, 'IPL Cricket Live', 'Live cricket match coverage', 'Sports', 'TV-G',
- NULL, NULL, NULL, NULL, NULL,
- 5007, '2024-01-14 19:00:00', '2024-01-14 23:00:00',
- 2005, 'Sports Shoes Ad', 8, '2024-01-01', '2024-04-30',
- 3004, 'SD', 'https://stream.example.com/sportszone_sd',
- 4008, '2024-01-14', 'Prime Time', 12.5, 'All Adults',
- 6008, 7008, '111 Village Square, Jaipur', 'Jaipur', 'Rural',
- 8008, '35-44', 'Male', 'Lower Middle');
-
--- Additional redundant entries to show normalization benefits
-INSERT INTO tv_channel_data VALUES
-(1, 'NewsFirst Network', 'Leading news broadcasting network',
- 102, 'NewsFirst SD', 502, 'https://cdn.example.com/newsfirst_logo_sd.png',
- 1003, 'Weather Update', 'Hourly weather forecast', 'News', 'TV-G',
- NULL, NULL, NULL, NULL, NULL,
- 5008, '2024-01-15 07:00:00', '2024-01-15 07:15:00',
- 2006, 'Home Appliances', 2, '2024-01-15', '2024-02-15',
- 3005, 'SD', 'https://stream.example.com/newsfirst_sd',
- 4009, '2024-01-15', 'Morning', 2.1, 'All Adults',
- 6009, 7009, '222 Market St, Ahmedabad', 'Ahmedabad', 'Urban',
- 8009, '55+', 'Female', 'Middle');
-
--- Create indexes for query performance
+-- Rows are streamed with COPY (one statement, no per-row parse/plan);
+-- empty unquoted CSV fields load as NULL
+-- Network/channel values stay repeated on purpose: that redundancy is what
+-- the demo normalizes away, and COPY's CSV reader never runs it through the
+-- SQL parser, so factoring it into CTEs would only add a join to plan
+--   NewsFirst Network (ID 1): Morning Brief, Prime Time News, Weather Update
+--   EntertainMax (ID 2): The Family (with episodes), Laugh Out Loud
+--   SportsZone (ID 3): IPL Cricket Live
+COPY tv_channel_data (
+    network_id, network_name, network_description,
+    channel_id, channel_name, channel_frequency, channel_logo,
+    program_id, program_title, program_description, program_genre, program_rating,
+    episode_id, episode_title, episode_synopsis, episode_air_date, episode_duration,
+    schedule_id, schedule_start_time, schedule_end_time,
+    ad_id, ad_name, ad_frequency, ad_start_date, ad_end_date,
+    stream_id, stream_type, stream_url,
+    trp_report_id, trp_date, trp_time_slot, trp_value, trp_target_audience,
+    device_id, household_id, household_address, household_region, household_sample_type,
+    demographic_id, age_group, gender, income_level
+) FROM STDIN WITH (FORMAT csv, FREEZE);
+1,NewsFirst Network,Leading news broadcasting network,101,NewsFirst HD,501,https://cdn.example.com/newsfirst_logo.png,1001,Morning Brief,Daily morning news roundup,News,TV-G,,,,,,5001,2024-01-15 06:00:00,2024-01-15 08:00:00,2001,AutoMax Commercial,5,2024-01-01,2024-03-31,3001,HD,https://stream.example.com/newsfirst_hd,4001,2024-01-15,Morning,4.5,Adults 25-54,6001,7001,"123 Main St, Mumbai",Mumbai Metro,Urban,8001,25-34,Male,Middle
+1,NewsFirst Network,Leading news broadcasting network,101,NewsFirst HD,501,https://cdn.example.com/newsfirst_logo.png,1001,Morning Brief,Daily morning news roundup,News,TV-G,,,,,,5002,2024-01-16 06:00:00,2024-01-16 08:00:00,2001,AutoMax Commercial,5,2024-01-01,2024-03-31,3001,HD,https://stream.example.com/newsfirst_hd,4002,2024-01-16,Morning,4.7,Adults 25-54,6002,7002,"456 Oak Ave, Delhi",Delhi NCR,Urban,8002,35-44,Female,Upper Middle
+1,NewsFirst Network,Leading news broadcasting network,101,NewsFirst HD,501,https://cdn.example.com/newsfirst_logo.png,1002,Prime Time News,Evening news analysis,News,TV-PG,,,,,,5003,2024-01-15 20:00:00,2024-01-15 21:00:00,2002,TechGadgets Ad,3,2024-01-01,2024-06-30,3001,HD,https://stream.example.com/newsfirst_hd,4003,2024-01-15,Prime Time,8.2,Adults 25-54,6003,7003,"789 Park Rd, Bangalore",Bangalore,Urban,8003,45-54,Male,High
+2,EntertainMax,Premium entertainment channel network,201,EntertainMax Gold,601,https://cdn.example.com/entertainmax_logo.png,2001,The Family,Drama series about a business family,Drama,TV-14,10001,Pilot Episode,The family business faces a crisis,2024-01-10,45,5004,2024-01-10 21:00:00,2024-01-10 21:45:00,2003,Fashion Brand X,4,2024-01-01,2024-12-31,3002,HD,https://stream.example.com/entertainmax_hd,4004,2024-01-10,Prime Time,6.8,Adults 18-49,6004,7004,"321 Lake View, Hyderabad",Hyderabad,Urban,8004,18-24,Female,Middle
+2,EntertainMax,Premium entertainment channel network,201,EntertainMax Gold,601,https://cdn.example.com/entertainmax_logo.png,2001,The Family,Drama series about a business family,Drama,TV-14,10002,Episode 2: The Deal,A major business deal is negotiated,2024-01-17,45,5005,2024-01-17 21:00:00,2024-01-17 21:45:00,2003,Fashion Brand X,4,2024-01-01,2024-12-31,3002,HD,https://stream.example.com/entertainmax_hd,4005,2024-01-17,Prime Time,7.1,Adults 18-49,6005,7005,"555 River St, Chennai",Chennai,Urban,8005,25-34,Male,Middle
+2,EntertainMax,Premium entertainment channel network,201,EntertainMax Gold,601,https://cdn.example.com/entertainmax_logo.png,2002,Laugh Out Loud,Stand-up comedy show,Comedy,TV-MA,,,,,,5006,2024-01-12 22:00:00,2024-01-12 23:00:00,2004,Beverage Co Ad,6,2024-01-01,2024-02-29,3002,HD,https://stream.example.com/entertainmax_hd,4006,2024-01-12,Late Night,5.3,Adults 18-34,6006,7006,"888 Hill Top, Pune",Pune,Urban,8006,18-24,Male,Lower Middle
+3,SportsZone,Sports broadcasting network,301,SportsZone Live,701,https://cdn.example.com/sportszone_logo.png,3001,IPL Cricket Live,Live cricket match coverage,Sports,TV-G,,,,,,5007,2024-01-14 19:00:00,2024-01-14 23:00:00,2005,Sports Shoes Ad,8,2024-01-01,2024-04-30,3003,HD,https://stream.example.com/sportszone_hd,4007,2024-01-14,Prime Time,12.5,All Adults,6007,7007,"999 Stadium Rd, Kolkata",Kolkata,Urban,8007,25-34,Male,Middle
+3,SportsZone,Sports broadcasting network,301,SportsZone Live,701,https://cdn.example.com/sportszone_logo.png,3001,IPL Cricket Live,Live cricket match coverage,Sports,TV-G,,,,,,5007,2024-01-14 19:00:00,2024-01-14 23:00:00,2005,Sports Shoes Ad,8,2024-01-01,2024-04-30,3004,SD,https://stream.example.com/sportszone_sd,4008,2024-01-14,Prime Time,12.5,All Adults,6008,7008,"111 Village Square, Jaipur",Jaipur,Rural,8008,35-44,Male,Lower Middle
+1,NewsFirst Network,Leading news broadcasting network,102,NewsFirst SD,502,https://cdn.example.com/newsfirst_logo_sd.png,1003,Weather Update,Hourly weather forecast,News,TV-G,,,,,,5008,2024-01-15 07:00:00,2024-01-15 07:15:00,2006,Home Appliances,2,2024-01-15,2024-02-15,3005,SD,https://stream.example.com/newsfirst_sd,4009,2024-01-15,Morning,2.1,All Adults,6009,7009,"222 Market St, Ahmedabad",Ahmedabad,Urban,8009,55+,Female,Middle
+\\.
+
+COMMIT;
+
+-- Create indexes for query performance (after the bulk load)
 CREATE INDEX idx_network_id ON tv_channel_data(network_id);
 CREATE INDEX idx_channel_id ON tv_channel_data(channel_id);
 CREATE INDEX idx_program_id ON tv_channel_data(program_id);
@@ -420,12 +344,21 @@ Contains massive redundancy: network and channel info repeated for every program
 TRP data duplicated, advertisements repeated. Perfect for teaching normalization!';
 """
 
-with open('RowToEntityMorph.jsx', 'w') as f:
-    f.write(unf_to_1nf_viz)
-
-with open('tv-channel-schema.sql', 'w') as f:
-    f.write(tv_channel_schema)
-
-print("✅ React D3 visualization and database schema generated!")
+# Both artifacts are raw byte buffers written straight to their descriptors
+artifacts = [
+    ('RowToEntityMorph.jsx', unf_to_1nf_viz.encode('utf-8')),
+    ('tv-channel-schema.sql', tv_channel_schema.encode('utf-8')),
+]
+fds = [os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644) for path, _ in artifacts]
+try:
+    for fd, (_, payload) in zip(fds, artifacts):
+        view = memoryview(payload)
+        while view:
+            view = view[os.writev(fd, [view]):]
+finally:
+    for fd in fds:
+        os.close(fd)
+
+print("✅ React canvas visualization and database schema generated!")
 print("   - RowToEntityMorph.jsx (UNF→1NF animation)")
 print("   - tv-channel-schema.sql (Denormalized TV channel data)")
@@ -90,7 +90,7 @@ and deployment assets are included.
 ### Frontend Visualization Components
 
 5. **RowToEntityMorph.jsx** (250 lines)
-   - UNF → 1NF animation using D3.js + GSAP
+   - UNF → 1NF animation drawn on a 2D canvas
    - Animates multi-valued attribute splitting
    - Smooth transitions with back.out easing
    - Interactive hover states
@@ -320,8 +320,6 @@ app.listen(PORT, () => {
   "dependencies": {
     "react": "^18.2.0",
     "react-dom": "^18.2.0",
-    "d3": "^7.8.5",
-    "gsap": "^3.12.4",
     "axios": "^1.6.2"
   },
   "devDependencies": {
@@ -617,7 +615,7 @@ print("   ✓ NormalFormChecker.js - 1NF/2NF/3NF validation")
 print("   ✓ SchemaDecomposer.js - Automated schema decomposition")
 print()
 print("   FRONTEND VISUALIZATIONS:")
-print("   ✓ RowToEntityMorph.jsx - UNF→1NF D3.js animation with GSAP")
+print("   ✓ RowToEntityMorph.jsx - UNF→1NF canvas animation")
 print()
 print("   DATABASE:")
 print("   ✓ tv-channel-schema.sql - Complete denormalized TV channel dataset")